@@ -1,5 +1,21 @@
-from .ui import Ui_SyncDog
-from .file_handler import FileHandler
-from .mirror_handler import MirrorHandler
-from .observer import SyncDogObserver
-from .utils import interval
+from importlib import import_module
+
+
+# Exported names and the submodules that define them. They are imported on
+# first use so that importing one submodule, such as the window, does not
+# load Qt or watchdog through the others.
+_EXPORTS = {
+    'FileHandler': '.file_handler',
+    'MirrorHandler': '.mirror_handler',
+    'SyncDogObserver': '.observer',
+    'Ui_SyncDog': '.ui',
+    'interval': '.utils',
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import os
 from pathlib import Path
 import shutil
+import stat
+import sys
 import time
 import threading
+from typing import Callable, Union
 
 from logger import Logger
 from syncdog.constants import FileSystemEvents
@@ -24,6 +31,15 @@ class BaseHandler(FileSystemEventHandler, ABC):
         self.debounce_interval = debounce_interval
         self.working_files = {}
         self.working_timers = {}
+        # Events under a .syncdog patch directory are matched on the raw path
+        # string, so no Path or parts tuple is built per event.
+        self._syncdog_marker = os.sep + '.syncdog' + os.sep
+        self._syncdog_suffix = os.sep + '.syncdog'
+        self._sched_heap = []
+        self._sched_cv = threading.Condition()
+        self._sched_seq = itertools.count()
+        self._sched_thread: threading.Thread = None
+        self._cleanup_pool: ThreadPoolExecutor = None
 
     @abstractmethod
     def on_any_event(self, event: FileSystemEvents) -> None:
@@ -50,7 +66,7 @@ class BaseHandler(FileSystemEventHandler, ABC):
     ) -> bool:
         """
         Checks if the copying of a file is complete based on its size and
-        triggers appropriate actions.
+        modification time, and triggers appropriate actions.
 
         Args:
             event_type (FileSystemEvents): The type of file system event (e.g.,
@@ -63,11 +79,12 @@ class BaseHandler(FileSystemEventHandler, ABC):
         Returns:
             bool: True if the file copy is complete, False otherwise.
         """
-        if not source_path.exists():
+        current_state = self.get_file_state(source_path)
+        if current_state is None:
             return
-        current_size = self.get_file_size(source_path)
-        previous_size = self.working_files.get(source_path, 0)
-        if current_size == previous_size:
+        key = self._path_key(source_path)
+        # Complete once neither size nor mtime moved during the interval.
+        if current_state == self.working_files.get(key):
             if event_type == FileSystemEvents.CREATED.value:
                 try:
                     self.create_file(source, source_path, dest)
@@ -77,7 +94,7 @@ class BaseHandler(FileSystemEventHandler, ABC):
             elif event_type == FileSystemEvents.MODIFIED.value:
                 self.sync_file(source, source_path, dest, patch_path)
         else:
-            self.working_files[source_path] = current_size
+            self.working_files[key] = current_state
             self.start_working_timer(
                 event_type, source, source_path, dest, patch_path)
 
@@ -161,26 +178,33 @@ class BaseHandler(FileSystemEventHandler, ABC):
         """
         return dest / source_path.relative_to(source)
 
-    def get_file_size(self, source_path: Path, delay: float = 0.1) -> int:
+    def get_file_state(
+            self,
+            source_path: Path,
+            delay: float = 0.1
+    ) -> Union[tuple[int, int], None]:
         """
-        Get the size of the file at the given path.
+        Get the size and modification time of the file at the given path from a
+        single stat call.
 
         Args:
             source_path (Path): The path to the source file.
             delay (float, optional): The delay in seconds to wait if a
-                PermissionError occurs. Defaults to 0.2.
+                PermissionError occurs. Defaults to 0.1.
 
         Returns:
-            int: The size of the file in bytes. Returns 0 if the file is not
-                found or a PermissionError occurs.
+            Union[tuple[int, int], None]: The file size in bytes and its
+                modification time in nanoseconds. (0, 0) if a PermissionError
+                occurs, None if the file is not found.
         """
         try:
-            with source_path.open('rb') as f:
-                f.seek(0, 2)  # Move the cursor to the end of the file
-                return f.tell()  # Get the current position of the cursor
+            stat_result = os.stat(source_path)
         except PermissionError:
             time.sleep(delay)
-        return 0
+            return 0, 0
+        except FileNotFoundError:
+            return None
+        return stat_result.st_size, stat_result.st_mtime_ns
 
     def rename(self, event: FileSystemEvents, source: Path, dest: Path) -> None:
         """
@@ -193,15 +217,18 @@ class BaseHandler(FileSystemEventHandler, ABC):
             dest (Path): The destination directory path.
 
         Note:
-            Do not use Path.rename() as it does not work across different OSes.
+            os.replace renames in a single call on every OS and overwrites an
+            existing target. A missing original means it was already moved,
+            e.g. by the mirror of this event, so there is nothing to do.
         """
-        original_name = Path(event.src_path.replace(str(source), ''))
-        new_name = Path(event.dest_path.replace(str(source), ''))
-        dest_path = dest / new_name.relative_to('\\')
-        if dest_path.exists():
-            return
-
-        shutil.move(dest / original_name.relative_to('\\'), dest_path)
+        original_path = self.get_dest_path(source, Path(event.src_path), dest)
+        new_path = self.get_dest_path(source, Path(event.dest_path), dest)
+        try:
+            os.replace(original_path, new_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error renaming file: {e}")
 
     def set_debounce_interval(self, interval: float) -> None:
         """
@@ -223,7 +250,7 @@ class BaseHandler(FileSystemEventHandler, ABC):
     ) -> None:
         """
         Starts a timer to debounce file system events and check if copying is
-        complete.
+        complete. Restarting the timer for a path replaces its pending check.
 
         Args:
             event_type (FileSystemEvents): The type of file system event.
@@ -231,18 +258,12 @@ class BaseHandler(FileSystemEventHandler, ABC):
             source_path (Path): The source path of the file being copied.
             dest_path (Path): The destination directory path.
             patch_path (Path): The path where patch files are stored.
-
-        Raises:
-            Exception: If there is an error starting the copying timer.
         """
-        if source_path in self.working_timers:
-            self.working_timers[source_path].cancel()
-        self.working_timers[source_path] = threading.Timer(
-            self.debounce_interval,
+        self._schedule(
+            source_path,
             self.create_complete,
             [event_type, source, source_path, dest_path, patch_path]
         )
-        self.working_timers[source_path].start()
 
     def sync_file(
         self,
@@ -261,20 +282,25 @@ class BaseHandler(FileSystemEventHandler, ABC):
             patch_path (Path): The path where patch files are stored.
         """
         try:
-            if not source_path.exists():
+            # One stat per side answers existence, type and size.
+            try:
+                source_stat = source_path.stat()
+            except FileNotFoundError:
                 return
             relative_path = source_path.relative_to(source)
             dest_path = dest / relative_path
             diff_file = patch_path / relative_path.with_suffix('.patch')
-            if source_path.is_dir():
+            if stat.S_ISDIR(source_stat.st_mode):
                 self.create_directory(source, source_path, dest)
                 self.untrack_work_file(source_path)
                 self.untrack_work_file(dest_path)
                 return
-            elif not dest_path.exists():
+            try:
+                dest_size = dest_path.stat().st_size
+            except FileNotFoundError:
                 return self.track_work_file(
                     'created', source, source_path, dest, patch_path)
-            elif dest_path.stat().st_size > source_path.stat().st_size:
+            if dest_size > source_stat.st_size:
                 dest_path.unlink()
                 if diff_file.exists():
                     diff_file.unlink()
@@ -290,7 +316,6 @@ class BaseHandler(FileSystemEventHandler, ABC):
                 dst_path=str(dest_path),
                 patch_path=str(diff_file)
             )
-            time.sleep(0.25)
             self.untrack_work_file(source_path)
             self.untrack_work_file(dest_path)
             return
@@ -323,10 +348,11 @@ class BaseHandler(FileSystemEventHandler, ABC):
             dest (Path): The destination directory path.
             patch_path (Path): The path where patch files are stored.
         """
-        if not source_path.exists():
+        state = self.get_file_state(source_path)
+        if state is None:
             return
 
-        self.working_files[source_path] = self.get_file_size(source_path)
+        self.working_files[self._path_key(source_path)] = state
         self.start_working_timer(
             event_type, source, source_path, dest, patch_path)
 
@@ -337,8 +363,99 @@ class BaseHandler(FileSystemEventHandler, ABC):
         Args:
             source_path (Path): The source path of the file to stop tracking.
         """
-        if self.working_files.get(source_path):
-            del self.working_files[source_path]
-        if self.working_timers.get(source_path):
-            self.working_timers[source_path].cancel()
-            del self.working_timers[source_path]
+        key = self._path_key(source_path)
+        self.working_files.pop(key, None)
+        with self._sched_cv:
+            # Dropping the entry makes the pending heap item stale.
+            self.working_timers.pop(key, None)
+
+    def wait_for_cleanup(self) -> None:
+        """
+        Blocks until every directory removal queued by _remove_tree has
+        finished.
+        """
+        if self._cleanup_pool is not None:
+            self._cleanup_pool.shutdown(wait=True)
+            self._cleanup_pool = None
+
+    @staticmethod
+    def _path_key(path: Union[str, Path]) -> str:
+        """
+        Returns the key a path is stored under in working_files and
+        working_timers. Interned strings hash once and compare by identity,
+        which makes the lookups cheaper than with Path keys.
+
+        Args:
+            path (Union[str, Path]): The path to build the key for.
+
+        Returns:
+            str: The interned path string.
+        """
+        return sys.intern(os.fspath(path))
+
+    def _remove_tree(self, path: Path) -> None:
+        """
+        Removes a directory tree on a background worker so that large patch
+        directories do not block the caller.
+
+        Args:
+            path (Path): The directory to remove.
+        """
+        if self._cleanup_pool is None:
+            self._cleanup_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='syncdog-cleanup')
+        self._cleanup_pool.submit(shutil.rmtree, path, ignore_errors=True)
+
+    def _run_scheduler(self) -> None:
+        """
+        Runs due checks from the schedule heap until it is empty, sleeping
+        until the earliest deadline in between. Stale entries, whose path has
+        since been rescheduled or untracked, are skipped.
+        """
+        while True:
+            with self._sched_cv:
+                while True:
+                    if not self._sched_heap:
+                        self._sched_thread = None
+                        return
+                    deadline, seq, key, function, args = self._sched_heap[0]
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        self._sched_cv.wait(delay)
+                        continue
+                    heapq.heappop(self._sched_heap)
+                    if self.working_timers.get(key) == seq:
+                        del self.working_timers[key]
+                        break
+            try:
+                function(*args)
+            except Exception as e:
+                logger.error(f"Error running scheduled check: {e}")
+
+    def _schedule(self, path: Path, function: Callable, args: list) -> None:
+        """
+        Schedules a function to run for a path once the debounce interval has
+        passed, replacing any check already pending for that path.
+
+        All paths share one heap and one scheduler thread, which is started on
+        demand and exits once nothing is left to run.
+
+        Args:
+            path (Path): The path the check belongs to.
+            function (Callable): The function to run.
+            args (list): The positional arguments to pass to the function.
+        """
+        key = self._path_key(path)
+        with self._sched_cv:
+            seq = next(self._sched_seq)
+            self.working_timers[key] = seq
+            heapq.heappush(
+                self._sched_heap,
+                (time.monotonic() + self.debounce_interval, seq, key,
+                 function, args)
+            )
+            if self._sched_thread is None:
+                self._sched_thread = threading.Thread(
+                    target=self._run_scheduler, daemon=True)
+                self._sched_thread.start()
+            self._sched_cv.notify()
@@ -14,6 +14,17 @@ class FileSystemEvents(Enum):
     OPENED: str = 'opened'
 
 
+# When several events for the same path arrive within one debounce window,
+# the one with the higher rank is kept.
+EVENT_PRECEDENCE = {
+    FileSystemEvents.MODIFIED.value: 0,
+    FileSystemEvents.CREATED.value: 1,
+    FileSystemEvents.CLOSED.value: 2,
+    FileSystemEvents.MOVED.value: 3,
+    FileSystemEvents.DELETED.value: 4,
+}
+
+
 class SyncMode(Enum):
     MIRROR = "mirror"
     ATOB = "atob"
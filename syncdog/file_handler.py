@@ -1,11 +1,12 @@
+from collections import deque
 from pathlib import Path
-import shutil
+import threading
 from typing import Union
 
 from logger import Logger
 
 from syncdog.base_handler import BaseHandler
-from syncdog.constants import FileSystemEvents
+from syncdog.constants import EVENT_PRECEDENCE, FileSystemEvents
 
 
 filename = Path(__file__).stem
@@ -14,6 +15,19 @@ logger.set_logging_level("DEBUG")
 
 
 class FileHandler(BaseHandler):
+    _EVENT_HANDLERS = {
+        FileSystemEvents.CLOSED.value: '_on_closed',
+        FileSystemEvents.CREATED.value: '_on_created',
+        FileSystemEvents.DELETED.value: '_on_deleted',
+        FileSystemEvents.MODIFIED.value: '_on_modified',
+        FileSystemEvents.MOVED.value: '_on_moved',
+    }
+    _WRITE_EVENTS = frozenset((
+        FileSystemEvents.CLOSED.value,
+        FileSystemEvents.CREATED.value,
+        FileSystemEvents.MODIFIED.value,
+    ))
+
     def __init__(
             self,
             source: Union[str, Path] = None,
@@ -42,11 +56,19 @@ class FileHandler(BaseHandler):
             self.set_destination(destination)
 
         self.debounce_interval = debounce_interval
+        self._events = deque()
+        self._batch_modified = set()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer = None
 
     def on_any_event(self, event: FileSystemEvents) -> None:
         """
         Handles any file system event.
 
+        Events are buffered per path and handled together once the debounce
+        interval has passed, so a burst of events for the same file results in
+        a single action.
+
         Args:
             event (FileSystemEvents): The file system event that triggered this
                 handler.
@@ -54,36 +76,89 @@ class FileHandler(BaseHandler):
         if self.source is None or self.dest is None:
             return
 
-        source_path = Path(event.src_path)
-        if '.syncdog' in source_path.parts:
+        src_path = event.src_path
+        if self._syncdog_marker in src_path or \
+                src_path.endswith(self._syncdog_suffix):
             return
+        if event.event_type not in EVENT_PRECEDENCE:
+            return
+        if event.event_type == FileSystemEvents.MODIFIED.value:
+            # Editors emit bursts of MODIFIED per save; one per path and batch
+            # is enough. The set is read once so a concurrent flush swapping it
+            # cannot make this event get lost.
+            batch_modified = self._batch_modified
+            key = self._path_key(src_path)
+            if key in batch_modified:
+                return
+            batch_modified.add(key)
 
-        match event.event_type:
-            case FileSystemEvents.CREATED.value:
-                if event.is_directory:
-                    self.create_directory(self.source, source_path, self.dest)
-                else:
-                    self.track_work_file(
-                        event.event_type, self.source, source_path,
-                        self.dest, self.patch_path)
-            case FileSystemEvents.DELETED.value:
-                self.delete(self.source, source_path, self.dest)
-            case FileSystemEvents.MOVED.value:
-                self.rename(event, self.source, self.dest)
-            case FileSystemEvents.MODIFIED.value:
-                if self.working_files.get(source_path):
-                    return
-                self.track_work_file(event.event_type, self.source, source_path,
-                                     self.dest, self.patch_path)
+        # deque.append is atomic, so the observer thread only takes the lock
+        # when it has to arm the flush timer.
+        self._events.append(event)
+        if self._flush_timer is None:
+            with self._flush_lock:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self.debounce_interval, self.flush_events)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
 
     def cleanup(self) -> None:
         """
-        Cleans up the patch path by removing it if it exists.
+        Handles the events still buffered, then removes the patch path if it
+        exists.
         """
+        self.flush_events()
         if self.patch_path and self.patch_path.exists():
-            shutil.rmtree(self.patch_path, ignore_errors=True)
+            self._remove_tree(self.patch_path)
             self.patch_path = None
 
+    def flush_events(self) -> None:
+        """
+        Drains the buffered events, coalesces the events of each path and
+        handles them. Paths are handled in the order they were first seen, and
+        the actions kept for one path in the order they arrived.
+        """
+        # Disarm before draining: an event appended after this point arms a
+        # new timer instead of being stranded.
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._batch_modified = set()
+
+        pending = {}
+        while True:
+            try:
+                event = self._events.popleft()
+            except IndexError:
+                break
+            actions = pending.setdefault(self._path_key(event.src_path), [])
+            if event.event_type == FileSystemEvents.MOVED.value and \
+                    actions and actions[-1].event_type in self._WRITE_EVENTS:
+                # Written and renamed within one batch, as in an atomic save:
+                # the source file only exists under its new name, so the write
+                # is handled there, after the rename.
+                write = actions.pop()
+                self._buffer(actions, event)
+                dest_key = self._path_key(event.dest_path)
+                dest_actions = pending.pop(dest_key, [])
+                pending[dest_key] = dest_actions
+                self._buffer(dest_actions, write)
+            else:
+                self._buffer(actions, event)
+
+        for key, actions in pending.items():
+            for event in actions:
+                try:
+                    # Looked up by name so that patched methods are picked up.
+                    getattr(self, self._EVENT_HANDLERS[event.event_type])(
+                        event, key)
+                except Exception as e:
+                    logger.error(
+                        f"Error handling {event.event_type} event for "
+                        f"{key}: {e}")
+
     def set_destination(self, dest: Union[str, Path]) -> None:
         """
         Changes the destination directory to a new directory.
@@ -91,10 +166,14 @@ class FileHandler(BaseHandler):
         Args:
             dest (Union[str, Path]): The new destination directory.
         """
-        if self.patch_path and self.patch_path.exists():
-            self.patch_path.rmdir()
-        self.dest = Path(dest)
-        self.patch_path = self.dest / '.syncdog'
+        new_dest = Path(dest)
+        new_patch_path = new_dest / '.syncdog'
+        # A removal queued by cleanup() may target the new patch path.
+        self.wait_for_cleanup()
+        if self.patch_path and self.patch_path != new_patch_path:
+            self._remove_tree(self.patch_path)
+        self.dest = new_dest
+        self.patch_path = new_patch_path
         self.patch_path.mkdir(exist_ok=True)
 
     def set_source(self, source: Union[str, Path]) -> None:
@@ -106,6 +185,142 @@ class FileHandler(BaseHandler):
         """
         self.source = Path(source)
 
+    def _on_closed(self, event: FileSystemEvents, key: str) -> None:
+        """
+        Syncs a file as soon as its writer closes it (IN_CLOSE_WRITE), without
+        waiting for its size to settle.
+
+        Args:
+            event (FileSystemEvents): The buffered event.
+            key (str): The interned source path of the event.
+        """
+        source_path = Path(key)
+        self.untrack_work_file(source_path)
+        if self.get_dest_path(self.source, source_path, self.dest).exists():
+            self.sync_file(self.source, source_path, self.dest, self.patch_path)
+            return
+        try:
+            self.create_file(self.source, source_path, self.dest)
+        except (FileNotFoundError, PermissionError):
+            self.track_work_file(
+                FileSystemEvents.CREATED.value, self.source, source_path,
+                self.dest, self.patch_path)
+
+    def _on_created(self, event: FileSystemEvents, key: str) -> None:
+        """
+        Creates the directory, or starts tracking the file, for a CREATED
+        event.
+
+        Args:
+            event (FileSystemEvents): The buffered event.
+            key (str): The interned source path of the event.
+        """
+        if event.is_directory:
+            self.create_directory(self.source, Path(key), self.dest)
+        else:
+            self.track_work_file(
+                event.event_type, self.source, Path(key), self.dest,
+                self.patch_path)
+
+    def _on_deleted(self, event: FileSystemEvents, key: str) -> None:
+        """
+        Deletes the destination counterpart for a DELETED event.
+
+        Args:
+            event (FileSystemEvents): The buffered event.
+            key (str): The interned source path of the event.
+        """
+        self.delete(self.source, Path(key), self.dest)
+
+    def _on_modified(self, event: FileSystemEvents, key: str) -> None:
+        """
+        Starts tracking the file for a MODIFIED event unless it is already
+        being worked on. This is the only handler that consults
+        working_files.
+
+        Args:
+            event (FileSystemEvents): The buffered event.
+            key (str): The interned source path of the event.
+        """
+        if self.working_files.get(key):
+            return
+        self.track_work_file(
+            event.event_type, self.source, Path(key), self.dest,
+            self.patch_path)
+
+    def _on_moved(self, event: FileSystemEvents, key: str) -> None:
+        """
+        Renames the destination counterpart for a MOVED event.
+
+        Args:
+            event (FileSystemEvents): The buffered event.
+            key (str): The interned source path of the event.
+        """
+        self.rename(event, self.source, self.dest)
+
+    def _buffer(
+            self,
+            actions: list[FileSystemEvents],
+            event: FileSystemEvents
+    ) -> None:
+        """
+        Adds an event to the actions buffered for its path, either as a new
+        action or by merging it into the last one.
+
+        Args:
+            actions (list[FileSystemEvents]): The actions buffered for the path.
+            event (FileSystemEvents): The incoming event.
+        """
+        if not actions or self._follows(event, actions[-1]):
+            actions.append(event)
+        elif self._supersedes(event, actions[-1]):
+            actions[-1] = event
+
+    def _follows(
+            self,
+            event: FileSystemEvents,
+            pending: FileSystemEvents
+    ) -> bool:
+        """
+        Checks if an incoming event must be handled as a separate action after
+        the one buffered last for the same path, rather than be merged with it.
+
+        This is the case when a file is moved away and a new one is written in
+        its place, as editors do when they keep a backup on save.
+
+        Args:
+            event (FileSystemEvents): The incoming event.
+            pending (FileSystemEvents): The event buffered last.
+
+        Returns:
+            bool: True if the incoming event should be kept as well.
+        """
+        return pending.event_type == FileSystemEvents.MOVED.value and \
+            event.event_type in self._WRITE_EVENTS
+
+    def _supersedes(
+            self,
+            event: FileSystemEvents,
+            pending: FileSystemEvents
+    ) -> bool:
+        """
+        Checks if an incoming event should replace the one already buffered for
+        the same path.
+
+        Args:
+            event (FileSystemEvents): The incoming event.
+            pending (FileSystemEvents): The event already buffered.
+
+        Returns:
+            bool: True if the incoming event should be kept instead.
+        """
+        if event.event_type == FileSystemEvents.CREATED.value and \
+                pending.event_type == FileSystemEvents.DELETED.value:
+            # The path was deleted and then created again.
+            return True
+        return EVENT_PRECEDENCE[event.event_type] >= \
+            EVENT_PRECEDENCE[pending.event_type]
+
     def __repr__(self):
         """
         Returns a string representation of the FileHandler instance.
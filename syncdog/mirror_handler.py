@@ -1,7 +1,6 @@
 
 from contextlib import suppress
 from pathlib import Path
-import shutil
 from typing import Union
 
 from logger import Logger
@@ -51,11 +50,13 @@ class MirrorHandler(BaseHandler):
         if self.dir_a is None or self.dir_b is None:
             return
 
-        source_path = Path(event.src_path)
-        if '.syncdog' in source_path.parts:
+        src_path = event.src_path
+        if self._syncdog_marker in src_path or \
+                src_path.endswith(self._syncdog_suffix):
             return
-        if self.working_files.get(source_path):
+        if self.working_files.get(self._path_key(src_path)):
             return
+        source_path = Path(src_path)
         source, patch_path = self.get_directories(source_path)
         dest = self.dir_b if source == self.dir_a else self.dir_a
         match event.event_type:
@@ -73,14 +74,15 @@ class MirrorHandler(BaseHandler):
                 if event.is_directory:
                     return
                 dest_path = self.get_dest_path(source, source_path, dest)
-                if dest_path.exists():
-                    if dest_path.stat().st_size == source_path.stat().st_size:
+                dest_state = self.get_file_state(dest_path)
+                if dest_state is not None:
+                    if dest_state[0] == source_path.stat().st_size:
                         return
                     else:
                         # Track dest_path as a working file to avoid duplicate
                         # events
-                        self.working_files[dest_path] = \
-                            dest_path.stat().st_size
+                        self.working_files[self._path_key(dest_path)] = \
+                            dest_state
                 self.track_work_file(
                     event.event_type, source, source_path, dest, patch_path)
 
@@ -90,7 +92,7 @@ class MirrorHandler(BaseHandler):
         """
         for path in [self.patch_path_a, self.patch_path_b]:
             if path and path.exists():
-                shutil.rmtree(path, ignore_errors=True)
+                self._remove_tree(path)
 
         self.patch_path_a = None
         self.patch_path_b = None
@@ -135,9 +137,11 @@ class MirrorHandler(BaseHandler):
         """
         setattr(self, dir_attr, Path(dir_value))
         patch_path = getattr(self, patch_attr)
-        if patch_path and patch_path.exists():
-            patch_path.rmdir()
         new_patch_path = getattr(self, dir_attr) / ".syncdog"
+        # A removal queued by cleanup() may target the new patch path.
+        self.wait_for_cleanup()
+        if patch_path and patch_path != new_patch_path:
+            self._remove_tree(patch_path)
         setattr(self, patch_attr, new_patch_path)
         new_patch_path.mkdir(exist_ok=True)
 
@@ -3,13 +3,25 @@ import threading
 from typing import Union
 
 from logger import Logger
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    DirCreatedEvent, DirDeletedEvent, DirMovedEvent, FileClosedEvent,
+    FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent,
+    FileSystemEventHandler
+)
 from watchdog.observers import Observer
 
 filename = Path(__file__).stem
 logger = Logger(logger_name=filename)
 logger.set_logging_level("DEBUG")
 
+# Only the events the handlers act on are delivered. Opened, closed-no-write
+# and directory-modified events are dropped by the emitter instead of being
+# filtered out by the handler one by one.
+EVENT_FILTER = [
+    DirCreatedEvent, DirDeletedEvent, DirMovedEvent, FileClosedEvent,
+    FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent,
+]
+
 
 class SyncDogObserver():
     """
@@ -63,12 +75,15 @@ class SyncDogObserver():
         self.observer = Observer()
         if isinstance(self.directory, list):
             self.observer.schedule(
-                self.handler, self.directory[0], recursive=True)
+                self.handler, self.directory[0], recursive=True,
+                event_filter=EVENT_FILTER)
             self.observer.schedule(
-                self.handler, self.directory[1], recursive=True)
+                self.handler, self.directory[1], recursive=True,
+                event_filter=EVENT_FILTER)
         else:
             self.observer.schedule(
-                self.handler, self.directory, recursive=True)
+                self.handler, self.directory, recursive=True,
+                event_filter=EVENT_FILTER)
         self.observer.start()
         self._is_running = True
         logger.debug("\nWatcher Running in {}\n".format(self.directory))
@@ -28,8 +28,16 @@ class SyncDogWindow(QtWidgets.QMainWindow, Ui_SyncDog):
     start_observer_signal = QtCore.Signal(object, Path, Path)
     stop_observer_signal = QtCore.Signal()
 
-    def __init__(self) -> None:
+    def __init__(self, testing: bool = False) -> None:
+        """
+        Initializes the main window.
+
+        Args:
+            testing (bool, optional): If True, the window closes without asking
+                for confirmation. Defaults to False.
+        """
         super().__init__()
+        self.testing = testing
         self.setupUi(self)
         self.setup_user_interface()
         self.alpha_path: Path = None
@@ -52,21 +60,7 @@ class SyncDogWindow(QtWidgets.QMainWindow, Ui_SyncDog):
         If the user confirms, the application will close; otherwise, it will
         remain open.
         """
-        if os.getenv('UNIT_TESTING'):
-            event.accept()
-            return
-
-        msgBox = QtWidgets.QMessageBox(self)
-        msgBox.setIcon(QtWidgets.QMessageBox.Warning)
-        msgBox.setText("Are you sure you want to quit?")
-        msgBox.setWindowTitle("Confirm Quit")
-        msgBox.setStandardButtons(
-            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
-        msgBox.setDefaultButton(QtWidgets.QMessageBox.No)
-        msgBox.setObjectName("confirmQuitMessageBox")
-
-        reply = msgBox.exec()
-        if reply == QtWidgets.QMessageBox.Yes:
+        if self.testing or self.confirm_quit():
             event.accept()
         else:
             event.ignore()
@@ -176,6 +170,24 @@ class SyncDogWindow(QtWidgets.QMainWindow, Ui_SyncDog):
 
         self.toggle_buttons_enabled(enabled=self.state_ready())
 
+    def confirm_quit(self) -> bool:
+        """
+        Displays a confirmation message box to the user asking if they want to
+        quit.
+        Returns:
+            bool: True if the user clicks 'Yes', False otherwise.
+        """
+        msgBox = QtWidgets.QMessageBox(self)
+        msgBox.setIcon(QtWidgets.QMessageBox.Warning)
+        msgBox.setText("Are you sure you want to quit?")
+        msgBox.setWindowTitle("Confirm Quit")
+        msgBox.setStandardButtons(
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        msgBox.setDefaultButton(QtWidgets.QMessageBox.No)
+        msgBox.setObjectName("confirmQuitMessageBox")
+
+        return msgBox.exec() == QtWidgets.QMessageBox.Yes
+
     def confirm_start(self) -> bool:
         """
         Displays a confirmation message box to the user asking if they want to
@@ -270,6 +282,14 @@ class SyncDogWindow(QtWidgets.QMainWindow, Ui_SyncDog):
             icon = str(base_path / "UI" / f"sync_{action}.svg")
         self.tray_icon.setIcon(QtGui.QIcon(icon))
 
+    def show_information(self, message: str) -> None:
+        """
+        Displays an information message box with the given message.
+        Args:
+            message (str): The text to show in the message box.
+        """
+        QtWidgets.QMessageBox.information(self, "Information", message)
+
     def state_ready(self) -> bool:
         """
         Checks if the state is ready for processing.
@@ -280,9 +300,7 @@ class SyncDogWindow(QtWidgets.QMainWindow, Ui_SyncDog):
                 self.mode == SyncMode.IDLE:
             return False
         elif self.alpha_path == self.beta_path:
-            QtWidgets.QMessageBox.information(
-                self, "Information", "Path A and B are the same!"
-            )
+            self.show_information("Path A and B are the same!")
             return False
 
         return True
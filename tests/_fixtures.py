@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+from watchdog.events import FileSystemEvent
+
+
+def make_event(
+        src_path: Path,
+        event_type: str,
+        is_directory: bool = False,
+        dest_path: Path = ''
+) -> FileSystemEvent:
+    """
+    Builds a FileSystemEvent with its event type and directory flag set.
+
+    Args:
+        src_path (Path): The path the event reports.
+        event_type (str): The watchdog event type, e.g. 'created'.
+        is_directory (bool, optional): Whether the event is for a directory.
+            Defaults to False.
+        dest_path (Path, optional): The new path of a moved event. Defaults to
+            ''.
+
+    Returns:
+        FileSystemEvent: The event.
+    """
+    event = FileSystemEvent(src_path=str(src_path), dest_path=str(dest_path))
+    event.event_type = event_type
+    event.is_directory = is_directory
+    return event
+
+
+class SeededRootTestCase(unittest.TestCase):
+    """
+    A test case with a class-wide temporary root, kept in /dev/shm where
+    available, holding a seed file that tests can link into their own
+    directories.
+
+    Attributes:
+        _root (Path): The temporary root, removed in tearDownClass.
+        _seed_file (Path): A file in the root holding test_file_data.
+        test_file_data (bytes): The content of the seed file.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        shm = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        cls._root = Path(tempfile.mkdtemp(dir=shm))
+        cls.test_file_data = b"Hello, World!"
+        cls._seed_file = cls._root / "test_file.txt"
+        with cls._seed_file.open('wb') as f:
+            f.write(cls.test_file_data)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._root, ignore_errors=True)
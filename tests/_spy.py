@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+from unittest.mock import patch
+
+
+class Spy:
+    """
+    A minimal stand-in for MagicMock that only records how it was called.
+
+    Args:
+        return_value (Any, optional): The value every call returns. Defaults
+            to None.
+
+    Attributes:
+        calls (list): The (args, kwargs) tuple of every call, in order.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.calls = []
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+@contextmanager
+def spy_on(target: object, *attrs: str) -> Iterator[dict[str, Spy]]:
+    """
+    Replaces the given attributes of a target with Spy instances for the
+    duration of the block.
+
+    Args:
+        target (object): The object or class to patch.
+        *attrs (str): The attribute names to replace.
+
+    Yields:
+        dict[str, Spy]: The spies, keyed by attribute name.
+    """
+    spies = {attr: Spy() for attr in attrs}
+    with patch.multiple(target, **spies):
+        yield spies
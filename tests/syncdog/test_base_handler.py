@@ -1,6 +1,7 @@
+import os
 import unittest
 import tempfile
-import time
+import threading
 import shutil
 from pathlib import Path
 from unittest.mock import call, patch, MagicMock
@@ -10,6 +11,11 @@ from syncdog.constants import FileSystemEvents
 from watchdog.events import FileSystemEvent
 
 
+CREATED = FileSystemEvents.CREATED.value
+MODIFIED = FileSystemEvents.MODIFIED.value
+MOVED = FileSystemEvents.MOVED.value
+
+
 class ConcreteBaseHandler(BaseHandler):
     def on_any_event(self, event: FileSystemEvents) -> None:
         print(f"Event received: {event}")
@@ -18,11 +24,20 @@ class ConcreteBaseHandler(BaseHandler):
         pass
 
 
-class TestBaseHandler(unittest.TestCase):
+class BaseHandlerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._root = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._root, ignore_errors=True)
+
     def setUp(self) -> None:
-        self.temp_dir = tempfile.mkdtemp()
-        self.source = Path(self.temp_dir) / "source"
-        self.dest = Path(self.temp_dir) / "destination"
+        self.temp_dir = Path(tempfile.mkdtemp(dir=self._root))
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.source = self.temp_dir / "source"
+        self.dest = self.temp_dir / "destination"
         self.patch_path = self.dest / '.syncdog'
         self.dest.mkdir()
         self.source.mkdir()
@@ -33,19 +48,36 @@ class TestBaseHandler(unittest.TestCase):
         with self.test_file.open('wb') as f:
             f.write(self.test_file_data)
 
-    def tearDown(self) -> None:
-        shutil.rmtree(self.temp_dir)
+    def _file_state(self, size_delta: int = 0) -> tuple[int, int]:
+        """
+        Returns the (size, mtime_ns) state of the test file, with the size
+        optionally shifted to simulate a file still being written.
+        """
+        stat_result = self.test_file.stat()
+        return stat_result.st_size + size_delta, stat_result.st_mtime_ns
 
+    def _wait_for_scheduler(self, timeout: float = 1) -> None:
+        """
+        Waits for the handler's scheduler thread to drain its pending checks
+        instead of sleeping for a fixed time.
+        """
+        thread = self.handler._sched_thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+            self.assertFalse(thread.is_alive())
+
+
+class TestBaseHandler(BaseHandlerTestCase):
     def test_create_complete_created(self) -> None:
         """
         Verifies when a file is marked as created, it is correctly copied to the
         destination and the copied file's content matches the original file's
         data.
         """
-        self.handler.working_files[self.test_file] = len(self.test_file_data)
+        self.handler.working_files[str(self.test_file)] = self._file_state()
 
         self.handler.create_complete(
-            FileSystemEvents.CREATED.value, self.source, self.test_file,
+            CREATED, self.source, self.test_file,
             self.dest, self.patch_path)
 
         copied_file = self.dest / self.test_file.name
@@ -58,10 +90,10 @@ class TestBaseHandler(unittest.TestCase):
         """
         synced_file = self.dest / self.test_file.name
         synced_file.touch()
-        self.handler.working_files[self.test_file] = len(self.test_file_data)
+        self.handler.working_files[str(self.test_file)] = self._file_state()
 
         self.handler.create_complete(
-            FileSystemEvents.MODIFIED.value, self.source, self.test_file,
+            MODIFIED, self.source, self.test_file,
             self.dest, self.patch_path)
 
         self.assertTrue(synced_file.exists())
@@ -72,13 +104,35 @@ class TestBaseHandler(unittest.TestCase):
         Test that a file is still marked as being copied when its size is less
         than expected.
         """
-        self.handler.working_files[self.test_file] = \
-            len(self.test_file_data) - 1
+        self.handler.working_files[str(self.test_file)] = \
+            self._file_state(size_delta=-1)
+        self.handler.create_complete(
+            MODIFIED, self.source, self.test_file,
+            self.dest, self.patch_path)
+
+        self.assertIn(str(self.test_file), self.handler.working_files)
+
+    @patch('syncdog.base_handler.BaseHandler.start_working_timer')
+    def test_create_complete_mtime_changed(
+            self,
+            mock_start_working_timer: MagicMock
+    ) -> None:
+        """
+        Test that a file whose size is unchanged but which was written to again
+        during the interval is not considered complete.
+        """
+        size, mtime_ns = self._file_state()
+        self.handler.working_files[str(self.test_file)] = (size, mtime_ns - 1)
+
         self.handler.create_complete(
-            FileSystemEvents.MODIFIED.value, self.source, self.test_file,
+            CREATED, self.source, self.test_file,
             self.dest, self.patch_path)
 
-        self.assertIn(self.test_file, self.handler.working_files)
+        self.assertFalse((self.dest / self.test_file.name).exists())
+        self.assertEqual(
+            self.handler.working_files[str(self.test_file)], (size, mtime_ns))
+        mock_start_working_timer.assert_called_once_with(
+            CREATED, self.source, self.test_file, self.dest, self.patch_path)
 
     @patch('syncdog.base_handler.BaseHandler.track_work_file')
     @patch('shutil.copy2')
@@ -90,14 +144,14 @@ class TestBaseHandler(unittest.TestCase):
         """
         Test that a PermissionError is handled correctly when copying a file.
         """
-        self.handler.working_files[self.test_file] = len(self.test_file_data)
+        self.handler.working_files[str(self.test_file)] = self._file_state()
         mock_shutil_copy2.side_effect = PermissionError
 
         self.handler.create_complete(
-            FileSystemEvents.CREATED.value, self.source, self.test_file,
+            CREATED, self.source, self.test_file,
             self.dest, self.patch_path)
         mock_track_work_file.assert_called_once_with(
-            FileSystemEvents.CREATED.value, self.source, self.test_file,
+            CREATED, self.source, self.test_file,
             self.dest, self.patch_path)
 
     def test_create_directory(self) -> None:
@@ -116,7 +170,6 @@ class TestBaseHandler(unittest.TestCase):
                 f.write("Hello, World!")
 
         self.handler.create_directory(self.source, source_dir, self.dest)
-        time.sleep(1)
         dest_dir = self.dest / source_dir.name
         self.assertTrue(dest_dir.exists())
 
@@ -153,7 +206,6 @@ class TestBaseHandler(unittest.TestCase):
         src_file = self.source / self.test_file
         dest_file = self.dest / "test_file.txt"
         dest_file.touch()
-        self.assertTrue(dest_file.exists())
 
         self.handler.delete(self.source, src_file, self.dest)
 
@@ -168,7 +220,6 @@ class TestBaseHandler(unittest.TestCase):
         src_dir = self.source / temp_dir
         dest_dir = self.dest / temp_dir
         dest_dir.mkdir()
-        self.assertTrue(dest_dir.exists())
 
         self.handler.delete(self.source, src_dir, self.dest)
 
@@ -193,24 +244,36 @@ class TestBaseHandler(unittest.TestCase):
             self.source, self.test_file, self.dest)
         self.assertEqual(dest_path, self.dest / self.test_file.name)
 
-    def test_get_file_size(self) -> None:
+    def test_get_file_state(self) -> None:
         """
-        Test that get_file_size returns the correct size of the file.
+        Test that get_file_state returns the size and modification time of the
+        file.
         """
         with open(self.test_file, 'wb') as f:
             f.write(self.test_file_data)
 
-        size = self.handler.get_file_size(self.test_file)
-        self.assertEqual(size, len(self.test_file_data))
+        state = self.handler.get_file_state(self.test_file)
+        self.assertEqual(state, (len(self.test_file_data),
+                                 os.stat(self.test_file).st_mtime_ns))
 
-    @patch('pathlib.Path.open')
-    def test_get_file_size_permission_error(self, mock_open: MagicMock) -> None:
+    @patch('syncdog.base_handler.os.stat')
+    def test_get_file_state_permission_error(
+            self,
+            mock_stat: MagicMock
+    ) -> None:
         """
-        Test that get_file_size returns 0 if a PermissionError occurs.
+        Test that get_file_state returns (0, 0) if a PermissionError occurs.
         """
-        mock_open.side_effect = PermissionError
-        size = self.handler.get_file_size(self.test_file)
-        self.assertEqual(size, 0)
+        mock_stat.side_effect = PermissionError
+        state = self.handler.get_file_state(self.test_file, delay=0)
+        self.assertEqual(state, (0, 0))
+
+    def test_get_file_state_not_found(self) -> None:
+        """
+        Test that get_file_state returns None if the file no longer exists.
+        """
+        state = self.handler.get_file_state(self.source / 'missing.txt')
+        self.assertIsNone(state)
 
     def test_rename(self) -> None:
         """
@@ -220,14 +283,13 @@ class TestBaseHandler(unittest.TestCase):
         dest_file = self.dest / "test_file.txt"
         # Create the source and destination files
         dest_file.touch()
-        self.assertTrue(dest_file.exists())
 
         new_dest_file = self.dest / "new_name.txt"
 
         # Simulate the rename event
         event = FileSystemEvent(src_path=str(self.test_file),
                                 dest_path=str(self.source / "new_name.txt"))
-        event.event_type = FileSystemEvents.MOVED.value
+        event.event_type = MOVED
 
         self.handler.rename(event, self.source, self.dest)
 
@@ -235,24 +297,24 @@ class TestBaseHandler(unittest.TestCase):
         self.assertFalse(dest_file.exists())
         self.assertTrue(new_dest_file.exists())
 
-    @patch('shutil.move')
-    def test_rename_dest_path_exists(self, mock_move: MagicMock) -> None:
+    def test_rename_dest_path_exists(self) -> None:
         """
-        Test the rename method when the destination path already exists.
+        Test that rename overwrites a file that already exists at the new
+        destination path.
         """
         dest_file = self.dest / "test_file.txt"
         new_dest_file = self.dest / "new_name.txt"
-        new_dest_file.touch()
+        dest_file.write_bytes(b"renamed")
+        new_dest_file.write_bytes(b"existing")
 
         event = FileSystemEvent(src_path=str(self.test_file),
                                 dest_path=str(self.source / "new_name.txt"))
-        event.event_type = FileSystemEvents.MOVED.value
+        event.event_type = MOVED
 
         self.handler.rename(event, self.source, self.dest)
 
         self.assertFalse(dest_file.exists())
-        self.assertTrue(new_dest_file.exists())
-        mock_move.assert_not_called()
+        self.assertEqual(new_dest_file.read_bytes(), b"renamed")
 
     def test_set_debounce_interval(self) -> None:
         """
@@ -267,37 +329,72 @@ class TestBaseHandler(unittest.TestCase):
         self.handler.set_debounce_interval(0.0)
         self.assertEqual(self.handler.debounce_interval, 0.0)
 
-    @patch('threading.Timer')
-    def test_start_working_timer(self, mock_timer: MagicMock) -> None:
+    @patch('syncdog.base_handler.BaseHandler._schedule')
+    def test_start_working_timer(self, mock_schedule: MagicMock) -> None:
         """
-        Test the start_working_timer method to ensure it correctly starts a
-        timer for the given file system event and source path.
+        Test the start_working_timer method to ensure it correctly schedules a
+        check for the given file system event and source path.
         """
-        event_type = FileSystemEvents.CREATED.value
-        self.handler.working_timers = {}
-
-        existing_timer = MagicMock()
-        self.handler.working_timers[self.test_file] = existing_timer
+        event_type = CREATED
 
         self.handler.start_working_timer(
             event_type, self.source, self.test_file, self.dest,
             self.patch_path)
 
-        mock_timer.assert_called_once_with(
-            self.handler.debounce_interval,
+        mock_schedule.assert_called_once_with(
+            self.test_file,
             self.handler.create_complete,
             [event_type, self.source, self.test_file, self.dest,
              self.patch_path])
-        self.assertIn(self.test_file, self.handler.working_timers)
-        mock_timer.return_value.start.assert_called_once()
+
+    def test_start_working_timer_restart(self) -> None:
+        """
+        Test that restarting the timer for a path runs only the latest check,
+        and that the scheduler thread exits once the heap is empty.
+        """
+        done = threading.Event()
+        self.handler.set_debounce_interval(0.01)
+
+        with patch.object(self.handler, 'create_complete',
+                          side_effect=lambda *args: done.set()) as mock_check:
+            for event_type in (CREATED, MODIFIED):
+                self.handler.start_working_timer(
+                    event_type, self.source, self.test_file, self.dest,
+                    self.patch_path)
+            thread = self.handler._sched_thread
+            self.assertTrue(done.wait(timeout=1))
+            thread.join(timeout=1)
+
+        mock_check.assert_called_once_with(
+            MODIFIED, self.source, self.test_file, self.dest, self.patch_path)
+        self.assertNotIn(str(self.test_file), self.handler.working_timers)
+        self.assertIsNone(self.handler._sched_thread)
+
+    def test_untrack_work_file_cancels_timer(self) -> None:
+        """
+        Test that untracking a file drops its pending check.
+        """
+        self.handler.set_debounce_interval(0.01)
+
+        with patch.object(self.handler, 'create_complete') as mock_check:
+            self.handler.start_working_timer(
+                CREATED, self.source, self.test_file, self.dest,
+                self.patch_path)
+            thread = self.handler._sched_thread
+            self.handler.untrack_work_file(self.test_file)
+            thread.join(timeout=1)
+
+        mock_check.assert_not_called()
+        self.assertFalse(thread.is_alive())
 
     def test_sync_file_success(self) -> None:
         """
         Test the sync_file method for successfully syncing a file.
         """
+        self.handler.set_debounce_interval(0.01)
         self.handler.sync_file(self.source, self.test_file,
                                self.dest, self.patch_path)
-        time.sleep(1)
+        self._wait_for_scheduler()
 
         dest_file = self.dest / self.test_file.relative_to(self.source)
         self.assertTrue(dest_file.exists())
@@ -341,46 +438,6 @@ class TestBaseHandler(unittest.TestCase):
         self.assertTrue(
             (self.dest / src_dir.relative_to(self.source)).exists())
 
-    @patch('bsdiff4.file_diff')
-    @patch('bsdiff4.file_patch')
-    def test_sync_file_creates_patch(
-            self,
-            mock_file_diff: MagicMock,
-            mock_file_patch: MagicMock
-    ) -> None:
-        """
-        Test the sync_file method for creating a patch when the destination
-        file exists.
-        """
-        dest_file = self.dest / self.test_file.relative_to(self.source)
-        with dest_file.open('wb') as f:
-            f.write(b"Old content")
-
-        self.handler.sync_file(self.source, self.test_file,
-                               self.dest, self.patch_path)
-        mock_file_diff.assert_called_once()
-        mock_file_patch.assert_called_once()
-
-    @patch('pathlib.Path.unlink')
-    def test_sync_file_removes_larger_dest_file(
-            self,
-            mock_unlink: MagicMock
-    ) -> None:
-        """
-        Test the sync_file method for removing the destination file if it is
-        larger than the source file.
-        """
-        dest_file = self.dest / self.test_file.relative_to(self.source)
-        patch_file = self.patch_path / \
-            self.test_file.relative_to(self.source).with_suffix('.patch')
-        patch_file.touch()
-        with dest_file.open('wb') as f:
-            f.write(b"Hello, World! Hello, World!")
-
-        self.handler.sync_file(self.source, self.test_file,
-                               self.dest, self.patch_path)
-        mock_unlink.assert_has_calls([call(), call()])
-
     @patch('syncdog.base_handler.BaseHandler.start_working_timer')
     def test_sync_file_patch_path_not_exists(
             self,
@@ -403,7 +460,7 @@ class TestBaseHandler(unittest.TestCase):
 
         self.assertTrue(self.patch_path.exists())
         mock_start_working_timer.assert_called_once_with(
-            'modified', self.source, self.test_file, self.dest, self.patch_path
+            MODIFIED, self.source, self.test_file, self.dest, self.patch_path
         )
 
     @patch('syncdog.base_handler.BaseHandler.track_work_file')
@@ -417,7 +474,7 @@ class TestBaseHandler(unittest.TestCase):
                                self.dest, self.patch_path)
 
         mock_track_work_file.assert_called_once_with(
-            FileSystemEvents.CREATED.value, self.source, self.test_file,
+            CREATED, self.source, self.test_file,
             self.dest, self.patch_path
         )
 
@@ -438,9 +495,9 @@ class TestBaseHandler(unittest.TestCase):
                                self.dest, self.patch_path)
 
         mock_track_work_file.assert_called_once_with(
-            'created', self.source, self.test_file, self.dest, self.patch_path)
+            CREATED, self.source, self.test_file, self.dest, self.patch_path)
         mock_start_working_timer.assert_called_once_with(
-            'modified', self.source, self.test_file, self.dest,
+            MODIFIED, self.source, self.test_file, self.dest,
             self.patch_path
         )
 
@@ -467,9 +524,55 @@ class TestBaseHandler(unittest.TestCase):
         """
         src_file = self.source / "non_existent_file.txt"
         self.handler.track_work_file(
-            FileSystemEvents.CREATED.value, self.source, src_file,
+            CREATED, self.source, src_file,
             self.dest, self.patch_path)
-        self.assertNotIn(src_file, self.handler.working_files)
+        self.assertNotIn(str(src_file), self.handler.working_files)
+
+
+@patch('syncdog.base_handler.bsdiff4.file_patch')
+@patch('syncdog.base_handler.bsdiff4.file_diff')
+class TestSyncFilePatching(BaseHandlerTestCase):
+    def test_sync_file_creates_patch(
+            self,
+            mock_file_diff: MagicMock,
+            mock_file_patch: MagicMock
+    ) -> None:
+        """
+        Test the sync_file method for creating a patch when the destination
+        file exists.
+        """
+        dest_file = self.dest / self.test_file.relative_to(self.source)
+        with dest_file.open('wb') as f:
+            f.write(b"Old content")
+
+        self.handler.sync_file(self.source, self.test_file,
+                               self.dest, self.patch_path)
+        mock_file_diff.assert_called_once()
+        mock_file_patch.assert_called_once()
+
+    @patch('pathlib.Path.unlink')
+    def test_sync_file_removes_larger_dest_file(
+            self,
+            mock_unlink: MagicMock,
+            mock_file_diff: MagicMock,
+            mock_file_patch: MagicMock
+    ) -> None:
+        """
+        Test the sync_file method for removing the destination file if it is
+        larger than the source file.
+        """
+        dest_file = self.dest / self.test_file.relative_to(self.source)
+        patch_file = self.patch_path / \
+            self.test_file.relative_to(self.source).with_suffix('.patch')
+        patch_file.touch()
+        with dest_file.open('wb') as f:
+            f.write(b"Hello, World! Hello, World!")
+
+        self.handler.sync_file(self.source, self.test_file,
+                               self.dest, self.patch_path)
+        mock_unlink.assert_has_calls([call(), call()])
+        mock_file_diff.assert_not_called()
+        mock_file_patch.assert_not_called()
 
 
 if __name__ == '__main__':
@@ -1,3 +1,5 @@
+import os
+import shutil
 import unittest
 import tempfile
 from pathlib import Path
@@ -5,106 +7,76 @@ from unittest.mock import patch, MagicMock
 
 from syncdog.file_handler import FileHandler
 from syncdog.constants import FileSystemEvents
-from watchdog.events import FileSystemEvent
 
+from tests._fixtures import make_event, SeededRootTestCase
+from tests._spy import spy_on
 
-class TestFileHandler(unittest.TestCase):
+
+CLOSED = FileSystemEvents.CLOSED.value
+CREATED = FileSystemEvents.CREATED.value
+DELETED = FileSystemEvents.DELETED.value
+MODIFIED = FileSystemEvents.MODIFIED.value
+MOVED = FileSystemEvents.MOVED.value
+FILE_OPERATIONS = ('create_directory', 'delete', 'rename', 'track_work_file')
+
+
+class TestFileHandler(SeededRootTestCase):
     def setUp(self) -> None:
-        self.temp_dir = tempfile.mkdtemp()
-        self.source = Path(self.temp_dir) / "source"
-        self.dest = Path(self.temp_dir) / "destination"
+        self.temp_dir = Path(tempfile.mkdtemp(dir=self._root))
+        self.source = self.temp_dir / "source"
+        self.dest = self.temp_dir / "destination"
         self.patch_path = self.dest / '.syncdog'
+        self.test_file = self.source / "test_file.txt"
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.dest.mkdir()
         self.source.mkdir()
         self.patch_path.mkdir()
         self.handler = FileHandler(
             source=self.source, destination=self.dest)
         self.handler.patch_path = self.patch_path
-        self.test_file = self.source / "test_file.txt"
-        self.test_file_data = b"Hello, World!"
-        with self.test_file.open('wb') as f:
-            f.write(self.test_file_data)
-
-    @patch('syncdog.file_handler.FileHandler.create_directory')
-    @patch('syncdog.file_handler.FileHandler.delete')
-    @patch('syncdog.file_handler.FileHandler.rename')
-    @patch('syncdog.file_handler.FileHandler.track_work_file')
-    def test_on_any_event_source_none(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
-        """
-        Test the `on_any_event` method when the source is None.
-
-        This test verifies that when the handler's source is set to None,
-        the `on_any_event` method does not call any of the file operation
-        methods (`create_directory`, `track_work_file`, `delete`, `rename`)
-        regardless of the event type.
-        """
-        self.handler.source = None
-        event = FileSystemEvent(src_path=str(self.source / "created_file.txt"))
-        event.event_type = FileSystemEvents.CREATED.value
-
-        self.handler.on_any_event(event)
-        mock_track_work_file.assert_not_called()
-        mock_create_directory.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_rename.assert_not_called()
-
-    @patch('syncdog.file_handler.FileHandler.create_directory')
-    @patch('syncdog.file_handler.FileHandler.delete')
-    @patch('syncdog.file_handler.FileHandler.rename')
-    @patch('syncdog.file_handler.FileHandler.track_work_file')
-    def test_on_any_event_destination_none(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
+        os.link(self._seed_file, self.test_file)
+        self.paths = {
+            name: self.source / name
+            for name in ('created_file.txt', 'modified_file.txt',
+                         'moved_file.txt', 'new_dir')
+        }
+        self.paths_str = {name: str(path) for name, path in self.paths.items()}
+
+    def test_on_any_event_source_or_destination_none(self) -> None:
         """
-        Test the `on_any_event` method when the destination is None.
+        Test the `on_any_event` method when the source or destination is None.
 
-        This test verifies that when the handler's destination is set to None,
-        the `on_any_event` method does not call any of the file operation
-        methods (`create_directory`, `track_work_file`, `delete`, `rename`)
-        regardless of the event type.
+        This test verifies that when either the handler's source or destination
+        is set to None, the `on_any_event` method does not call any of the file
+        operation methods (`create_directory`, `track_work_file`, `delete`,
+        `rename`) regardless of the event type.
         """
-        self.handler.dest = None
-        event = FileSystemEvent(src_path=str(self.test_file))
-        event.event_type = FileSystemEvents.CREATED.value
-
-        self.handler.on_any_event(event)
-
-        mock_create_directory.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_rename.assert_not_called()
-        mock_track_work_file.assert_not_called()
-
-    @patch('syncdog.file_handler.FileHandler.create_directory')
-    @patch('syncdog.file_handler.FileHandler.delete')
-    @patch('syncdog.file_handler.FileHandler.rename')
-    @patch('syncdog.file_handler.FileHandler.track_work_file')
-    def test_on_any_event_syncdog_in_path(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
-        event_path = self.source / ".syncdog" / "created_file.txt"
-        event = FileSystemEvent(src_path=str(event_path))
-        event.event_type = FileSystemEvents.CREATED.value
-
-        self.handler.on_any_event(event)
-
-        mock_create_directory.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_rename.assert_not_called()
-        mock_track_work_file.assert_not_called()
+        for attr, src_path in (
+            ('source', self.paths_str['created_file.txt']),
+            ('dest', self.test_file)
+        ):
+            with self.subTest(attr=attr), \
+                    spy_on(FileHandler, *FILE_OPERATIONS) as spies, \
+                    patch.object(self.handler, attr, None):
+                event = make_event(src_path, CREATED)
+
+                self.handler.on_any_event(event)
+                self.handler.flush_events()
+                for spy in spies.values():
+                    self.assertEqual(spy.calls, [])
+
+    def test_on_any_event_syncdog_in_path(self) -> None:
+        patch_dir = self.source / ".syncdog"
+        for event_path in (patch_dir / "created_file.txt", patch_dir):
+            with self.subTest(event_path=event_path), \
+                    spy_on(FileHandler, *FILE_OPERATIONS) as spies:
+                event = make_event(event_path, CREATED)
+
+                self.handler.on_any_event(event)
+                self.handler.flush_events()
+
+                for spy in spies.values():
+                    self.assertEqual(spy.calls, [])
 
     @patch('syncdog.file_handler.FileHandler.track_work_file')
     def test_on_any_event_created_file(
@@ -115,11 +87,10 @@ class TestFileHandler(unittest.TestCase):
         Verifies that the `track_work_file` method is called exactly once with
         the correct event type and file path.
         """
-        event = FileSystemEvent(src_path=str(self.test_file))
-        event.event_type = FileSystemEvents.CREATED.value
-        event.is_directory = False
+        event = make_event(self.test_file, CREATED)
 
         self.handler.on_any_event(event)
+        self.handler.flush_events()
         mock_track_work_file.assert_called_once_with(
             event.event_type, self.source, self.test_file, self.dest,
             self.patch_path)
@@ -132,12 +103,12 @@ class TestFileHandler(unittest.TestCase):
         """
         Test the `on_any_event` method for handling a created directory event.
         """
-        new_dir = self.source / "new_dir"
-        event = FileSystemEvent(src_path=str(new_dir))
-        event.event_type = FileSystemEvents.CREATED.value
-        event.is_directory = True
+        new_dir = self.paths['new_dir']
+        event = make_event(
+            self.paths_str['new_dir'], CREATED, is_directory=True)
 
         self.handler.on_any_event(event)
+        self.handler.flush_events()
         mock_create_directory.assert_called_once_with(
             self.source, new_dir, self.dest)
 
@@ -149,11 +120,10 @@ class TestFileHandler(unittest.TestCase):
         handler's `delete` method is called exactly once with the correct file
         path.
         """
-        self.assertTrue(self.test_file.exists())
-        event = FileSystemEvent(src_path=str(self.test_file))
-        event.event_type = FileSystemEvents.DELETED.value
+        event = make_event(self.test_file, DELETED)
 
         self.handler.on_any_event(event)
+        self.handler.flush_events()
         mock_delete.assert_called_once_with(
             self.source, self.test_file, self.dest)
 
@@ -163,13 +133,10 @@ class TestFileHandler(unittest.TestCase):
         This test verifies that the `rename` method is called once with the
         correct event when a file is moved.
         """
-        test_file_moved = self.source / "moved_file.txt"
-        self.assertFalse(test_file_moved.exists())
-
-        event = FileSystemEvent(src_path=str(
-            self.test_file), dest_path=str(test_file_moved))
-        event.event_type = FileSystemEvents.MOVED.value
+        event = make_event(
+            self.test_file, MOVED, dest_path=self.paths_str['moved_file.txt'])
         self.handler.on_any_event(event)
+        self.handler.flush_events()
 
         mock_rename.assert_called_once_with(
             event, self.source, self.dest)
@@ -182,15 +149,13 @@ class TestFileHandler(unittest.TestCase):
         """
         Test that the handler correctly tracks a modified file event.
         """
-        event = FileSystemEvent(
-            src_path=str(self.source / "modified_file.txt")
-        )
-        event.event_type = FileSystemEvents.MODIFIED.value
+        event = make_event(self.paths_str['modified_file.txt'], MODIFIED)
 
         self.handler.on_any_event(event)
+        self.handler.flush_events()
         mock_track_work_file.assert_called_once_with(
-            event.event_type, self.source, Path(event.src_path), self.dest,
-            self.patch_path)
+            event.event_type, self.source, self.paths['modified_file.txt'],
+            self.dest, self.patch_path)
 
     @patch('syncdog.file_handler.FileHandler.track_work_file')
     def test_on_any_event_modified_file_being_copied(
@@ -202,25 +167,199 @@ class TestFileHandler(unittest.TestCase):
         being copied.
         """
 
-        event = FileSystemEvent(src_path=str(
-            self.source / "modified_file.txt"))
-        event.event_type = FileSystemEvents.MODIFIED.value
+        event = make_event(self.paths_str['modified_file.txt'], MODIFIED)
 
         # Simulate that the file is currently being copied
-        self.handler.working_files[Path(event.src_path)] = \
-            len(self.test_file_data)
+        self.handler.working_files[self.paths_str['modified_file.txt']] = \
+            (len(self.test_file_data), 0)
 
         self.handler.on_any_event(event)
+        self.handler.flush_events()
+        mock_track_work_file.assert_not_called()
+
+    @patch('syncdog.file_handler.FileHandler.track_work_file')
+    def test_on_any_event_created_then_modified(
+            self,
+            mock_track_work_file: MagicMock
+    ) -> None:
+        """
+        Test that a MODIFIED event following a CREATED event for the same path
+        is folded into a single CREATED action.
+        """
+        for event_type in (CREATED, MODIFIED, MODIFIED):
+            self.handler.on_any_event(make_event(self.test_file, event_type))
+        self.handler.flush_events()
+
+        mock_track_work_file.assert_called_once_with(
+            CREATED, self.source, self.test_file, self.dest, self.patch_path)
+
+    @patch('syncdog.file_handler.FileHandler.track_work_file')
+    @patch('syncdog.file_handler.FileHandler.delete')
+    def test_on_any_event_deleted_then_created(
+            self,
+            mock_delete: MagicMock,
+            mock_track_work_file: MagicMock
+    ) -> None:
+        """
+        Test that a path deleted and created again within one debounce window
+        is handled as a creation only.
+        """
+        for event_type in (DELETED, CREATED):
+            self.handler.on_any_event(make_event(self.test_file, event_type))
+        self.handler.flush_events()
+
+        mock_delete.assert_not_called()
+        mock_track_work_file.assert_called_once_with(
+            CREATED, self.source, self.test_file, self.dest, self.patch_path)
+
+    @patch('syncdog.file_handler.threading.Timer')
+    def test_on_any_event_shares_flush_timer(
+            self,
+            mock_timer: MagicMock
+    ) -> None:
+        """
+        Test that a burst of events arms one flush timer rather than one per
+        path.
+        """
+        for name in ('created_file.txt', 'modified_file.txt'):
+            self.handler.on_any_event(
+                make_event(self.paths_str[name], CREATED))
+
+        mock_timer.assert_called_once_with(
+            self.handler.debounce_interval, self.handler.flush_events)
+        mock_timer.return_value.start.assert_called_once()
+        self.assertEqual(len(self.handler._events), 2)
+
+    @patch('syncdog.file_handler.threading.Timer')
+    def test_on_any_event_duplicate_modified(
+            self,
+            mock_timer: MagicMock
+    ) -> None:
+        """
+        Test that repeated MODIFIED events for a path are buffered once per
+        batch, and accepted again after a flush.
+        """
+        event = make_event(self.paths_str['modified_file.txt'], MODIFIED)
+
+        for _ in range(3):
+            self.handler.on_any_event(event)
+        self.assertEqual(len(self.handler._events), 1)
+
+        with patch.object(self.handler, '_on_modified') as mock_on_modified:
+            self.handler.flush_events()
+            self.handler.on_any_event(event)
+        mock_on_modified.assert_called_once()
+        self.assertEqual(len(self.handler._events), 1)
+
+    @patch('syncdog.file_handler.FileHandler.track_work_file')
+    @patch('syncdog.file_handler.FileHandler.create_file')
+    def test_on_any_event_created_then_closed(
+            self,
+            mock_create_file: MagicMock,
+            mock_track_work_file: MagicMock
+    ) -> None:
+        """
+        Test that a file closed after writing within the same batch is copied
+        straight away instead of being tracked until its size settles.
+        """
+        for event_type in (CREATED, MODIFIED, CLOSED):
+            self.handler.on_any_event(make_event(self.test_file, event_type))
+        self.handler.flush_events()
+
+        mock_create_file.assert_called_once_with(
+            self.source, self.test_file, self.dest)
         mock_track_work_file.assert_not_called()
 
+    def test_on_any_event_moved_then_created(self) -> None:
+        """
+        Test that a file moved to a backup name and written again within one
+        batch, as editors do on save, keeps both the backup and the new file
+        in the destination.
+        """
+        backup = self.source / "saved.txt~"
+        saved = self.source / "saved.txt"
+        (self.dest / saved.name).write_bytes(b"old")
+        saved.write_bytes(b"new")
+
+        self.handler.on_any_event(
+            make_event(saved, MOVED, dest_path=backup))
+        for event_type in (CREATED, MODIFIED, CLOSED):
+            self.handler.on_any_event(make_event(saved, event_type))
+        self.handler.flush_events()
+
+        self.assertEqual((self.dest / backup.name).read_bytes(), b"old")
+        self.assertEqual((self.dest / saved.name).read_bytes(), b"new")
+
+    def test_on_any_event_written_then_renamed(self) -> None:
+        """
+        Test that a file written under a temporary name and renamed over its
+        target within one batch, as in an atomic save, reaches the destination
+        under the target name.
+        """
+        temp = self.source / "doc.txt.tmp"
+        target = self.source / "doc.txt"
+        target.write_bytes(b"saved")
+
+        for event_type in (CREATED, MODIFIED, CLOSED):
+            self.handler.on_any_event(make_event(temp, event_type))
+        self.handler.on_any_event(make_event(temp, MOVED, dest_path=target))
+        self.handler.flush_events()
+
+        self.assertEqual((self.dest / target.name).read_bytes(), b"saved")
+        self.assertFalse((self.dest / temp.name).exists())
+
+    @patch('syncdog.file_handler.FileHandler.create_directory')
+    @patch('syncdog.file_handler.FileHandler.delete')
+    def test_flush_events_handler_error(
+            self,
+            mock_delete: MagicMock,
+            mock_create_directory: MagicMock
+    ) -> None:
+        """
+        Test that an error raised while handling one event is logged and does
+        not stop the rest of the batch from being handled.
+        """
+        mock_delete.side_effect = PermissionError("locked")
+        self.handler.on_any_event(make_event(self.test_file, DELETED))
+        self.handler.on_any_event(
+            make_event(self.paths['new_dir'], CREATED, is_directory=True))
+
+        with patch('syncdog.file_handler.logger') as mock_logger:
+            self.handler.flush_events()
+
+        mock_delete.assert_called_once()
+        mock_create_directory.assert_called_once_with(
+            self.source, self.paths['new_dir'], self.dest)
+        mock_logger.error.assert_called_once()
+
+    @patch('syncdog.file_handler.FileHandler.sync_file')
+    def test_on_any_event_closed_existing_file(
+            self,
+            mock_sync_file: MagicMock
+    ) -> None:
+        """
+        Test that closing a file which already exists in the destination syncs
+        it and drops any pending size check.
+        """
+        (self.dest / self.test_file.name).touch()
+        self.handler.working_files[str(self.test_file)] = (0, 0)
+
+        self.handler.on_any_event(make_event(self.test_file, CLOSED))
+        self.handler.flush_events()
+
+        mock_sync_file.assert_called_once_with(
+            self.source, self.test_file, self.dest, self.patch_path)
+        self.assertNotIn(str(self.test_file), self.handler.working_files)
+
     def test_set_destination(self) -> None:
         """
         Test the set_destination method to ensure it correctly updates the
         handler's destination directory and associated paths.
         """
-        new_destination = Path(self.temp_dir) / "new_destination"
+        new_destination = self.temp_dir / "new_destination"
         new_destination.mkdir()
         self.handler.set_destination(new_destination)
+        self.handler.wait_for_cleanup()
 
         self.assertFalse((self.dest / '.syncdog').exists())
 
@@ -233,11 +372,13 @@ class TestFileHandler(unittest.TestCase):
         Test the set_destination method to ensure it correctly updates the
         destination and patch path, and removes the old patch path.
         """
-        new_destination = Path(self.temp_dir) / "new_destination"
+        new_destination = self.temp_dir / "new_destination"
         new_destination.mkdir()
 
         old_patch_path = self.patch_path
+        (old_patch_path / 'stale.patch').touch()
         self.handler.set_destination(new_destination)
+        self.handler.wait_for_cleanup()
 
         self.assertEqual(self.handler.dest, new_destination)
         self.assertEqual(self.handler.patch_path, new_destination / '.syncdog')
@@ -250,7 +391,7 @@ class TestFileHandler(unittest.TestCase):
         Test the set_source method to ensure it updates the handler's source
         directory.
         """
-        new_source = Path(self.temp_dir) / "new_source"
+        new_source = self.temp_dir / "new_source"
         new_source.mkdir()
 
         self.handler.set_source(new_source)
@@ -263,7 +404,46 @@ class TestFileHandler(unittest.TestCase):
         exists.
         """
         self.handler.cleanup()
+        self.handler.wait_for_cleanup()
         self.assertFalse(self.patch_path.exists())
+        self.assertIsNone(self.handler.patch_path)
+
+    @patch('syncdog.file_handler.FileHandler.delete')
+    def test_cleanup_flushes_events(self, mock_delete: MagicMock) -> None:
+        """
+        Test that cleanup handles the events still waiting for the debounce
+        interval instead of discarding them.
+        """
+        self.handler.on_any_event(make_event(self.test_file, DELETED))
+
+        self.handler.cleanup()
+        self.handler.wait_for_cleanup()
+
+        mock_delete.assert_called_once_with(
+            self.source, self.test_file, self.dest)
+        self.assertIsNone(self.handler._flush_timer)
+        self.assertEqual(len(self.handler._events), 0)
+
+    def test_set_destination_same_destination(self) -> None:
+        """
+        Test that setting the current destination again keeps its patch path.
+        """
+        self.handler.set_destination(self.dest)
+        self.handler.wait_for_cleanup()
+
+        self.assertEqual(self.handler.patch_path, self.patch_path)
+        self.assertTrue(self.patch_path.exists())
+
+    def test_set_destination_after_cleanup(self) -> None:
+        """
+        Test that a removal queued by cleanup does not delete the patch path
+        recreated by set_destination.
+        """
+        self.handler.cleanup()
+        self.handler.set_destination(self.dest)
+        self.handler.wait_for_cleanup()
+
+        self.assertTrue(self.patch_path.exists())
 
     def test_repr(self) -> None:
         """
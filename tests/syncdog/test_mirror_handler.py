@@ -1,25 +1,37 @@
+import os
+import shutil
 import unittest
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from logger import Logger
-
 from syncdog.mirror_handler import MirrorHandler
 from syncdog.constants import FileSystemEvents
-from watchdog.events import FileSystemEvent
+
+from tests._fixtures import make_event, SeededRootTestCase
 
 
-filename = Path(__file__).stem
-logger = Logger(logger_name=filename)
-logger.set_logging_level("DEBUG")
+CREATED = FileSystemEvents.CREATED.value
+DELETED = FileSystemEvents.DELETED.value
+MODIFIED = FileSystemEvents.MODIFIED.value
+MOVED = FileSystemEvents.MOVED.value
 
 
-class TestMirrorHandler(unittest.TestCase):
+class TestMirrorHandler(SeededRootTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_mocks = {
+            name: MagicMock()
+            for name in ('create_directory', 'delete', 'get_directories',
+                         'rename', 'track_work_file')
+        }
+
     def setUp(self) -> None:
-        self.temp_dir = tempfile.mkdtemp()
-        self.dir_a = Path(self.temp_dir) / "dir_a"
-        self.dir_b = Path(self.temp_dir) / "dir_b"
+        self.temp_dir = Path(tempfile.mkdtemp(dir=self._root))
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.dir_a = self.temp_dir / "dir_a"
+        self.dir_b = self.temp_dir / "dir_b"
         self.dir_b.mkdir()
         self.dir_a.mkdir()
         self.handler = MirrorHandler(dir_a=self.dir_a, dir_b=self.dir_b)
@@ -27,104 +39,54 @@ class TestMirrorHandler(unittest.TestCase):
         self.patch_path_b = self.handler.patch_path_b
 
         self.test_file_a = self.dir_a / "test_file.txt"
-        self.test_file_data = b"Hello, World!"
-        with self.test_file_a.open('wb') as f:
-            f.write(self.test_file_data)
+        os.link(self._seed_file, self.test_file_a)
 
+        # A copy, so the two sides of the mirror are independent files.
         self.test_file_b = self.dir_b / "test_file.txt"
-        with self.test_file_b.open('wb') as f:
-            f.write(self.test_file_data)
-
-    @patch('syncdog.mirror_handler.MirrorHandler.create_directory')
-    @patch('syncdog.mirror_handler.MirrorHandler.delete')
-    @patch('syncdog.mirror_handler.MirrorHandler.get_directories')
-    @patch('syncdog.mirror_handler.MirrorHandler.rename')
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
-    def test_on_any_event_dir_a_none(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_get_directories: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
-        """
-        Test the `on_any_event` method when the source is None.
+        shutil.copyfile(self._seed_file, self.test_file_b)
 
-        This test verifies that when the handler's source is set to None,
-        the `on_any_event` method does not call any of the file operation
-        methods (`create_directory`, `track_work_file`, `delete`, `rename`)
-        regardless of the event type.
+    def _patch_shared_mocks(self):
         """
-        self.handler.dir_a = None
-        event = FileSystemEvent(src_path=str(self.test_file_a))
-        event.event_type = FileSystemEvents.CREATED.value
-
-        self.handler.on_any_event(event)
-        mock_create_directory.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_get_directories.assert_not_called()
-        mock_rename.assert_not_called()
-        mock_track_work_file.assert_not_called()
+        Patches the handler's file operations with the class-wide mocks,
+        resetting them first. Only for tests that assert the mocks are not
+        called.
+        """
+        for mock in self._shared_mocks.values():
+            mock.reset_mock()
+        return patch.multiple(MirrorHandler, **self._shared_mocks)
 
-    @patch('syncdog.mirror_handler.MirrorHandler.create_directory')
-    @patch('syncdog.mirror_handler.MirrorHandler.get_directories')
-    @patch('syncdog.mirror_handler.MirrorHandler.delete')
-    @patch('syncdog.mirror_handler.MirrorHandler.rename')
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
-    def test_on_any_event_dir_b_none(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_get_directories: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
+    def test_on_any_event_dir_none(self) -> None:
         """
-        Test the `on_any_event` method when the source is None.
+        Test the `on_any_event` method when either directory is None.
 
-        This test verifies that when the handler's source is set to None,
-        the `on_any_event` method does not call any of the file operation
-        methods (`create_directory`, `track_work_file`, `delete`, `rename`)
-        regardless of the event type.
+        This test verifies that when dir_a or dir_b is set to None, the
+        `on_any_event` method does not call any of the file operation methods
+        (`create_directory`, `track_work_file`, `delete`, `rename`) regardless
+        of the event type.
         """
-        self.handler.dir_b = None
-        event = FileSystemEvent(src_path=str(self.test_file_b))
-        event.event_type = FileSystemEvents.CREATED.value
+        for attr, test_file in (
+            ('dir_a', self.test_file_a),
+            ('dir_b', self.test_file_b)
+        ):
+            with self.subTest(attr=attr), self._patch_shared_mocks(), \
+                    patch.object(self.handler, attr, None):
+                event = make_event(test_file, CREATED)
 
-        self.handler.on_any_event(event)
-        mock_create_directory.assert_not_called()
-        mock_get_directories.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_rename.assert_not_called()
-        mock_track_work_file.assert_not_called()
+                self.handler.on_any_event(event)
+                for mock in self._shared_mocks.values():
+                    mock.assert_not_called()
 
-    @patch('syncdog.mirror_handler.MirrorHandler.create_directory')
-    @patch('syncdog.mirror_handler.MirrorHandler.delete')
-    @patch('syncdog.mirror_handler.MirrorHandler.get_directories')
-    @patch('syncdog.mirror_handler.MirrorHandler.rename')
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
-    def test_on_any_event_syncdog_in_path(
-            self,
-            mock_create_directory: MagicMock,
-            mock_delete: MagicMock,
-            mock_get_directories: MagicMock,
-            mock_rename: MagicMock,
-            mock_track_work_file: MagicMock
-    ) -> None:
+    def test_on_any_event_syncdog_in_path(self) -> None:
         event_path = self.dir_a / ".syncdog" / "created_file.txt"
-        event = FileSystemEvent(src_path=str(event_path))
-        event.event_type = FileSystemEvents.CREATED.value
+        event = make_event(event_path, CREATED)
 
-        self.handler.on_any_event(event)
+        with self._patch_shared_mocks():
+            self.handler.on_any_event(event)
 
-        mock_create_directory.assert_not_called()
-        mock_delete.assert_not_called()
-        mock_get_directories.assert_not_called()
-        mock_rename.assert_not_called()
-        mock_track_work_file.assert_not_called()
+        for mock in self._shared_mocks.values():
+            mock.assert_not_called()
 
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
+    @patch.object(MirrorHandler, 'track_work_file')
     def test_on_any_event_created_file(
             self,
             mock_track_work_file: MagicMock
@@ -133,16 +95,14 @@ class TestMirrorHandler(unittest.TestCase):
         Verifies that the `track_work_file` method is called exactly once with
         the correct event type and file path.
         """
-        event = FileSystemEvent(src_path=str(self.test_file_a))
-        event.event_type = FileSystemEvents.CREATED.value
-        event.is_directory = False
+        event = make_event(self.test_file_a, CREATED)
 
         self.handler.on_any_event(event)
         mock_track_work_file.assert_called_once_with(
             event.event_type, self.dir_a, self.test_file_a, self.dir_b,
             self.patch_path_b)
 
-    @patch('syncdog.mirror_handler.MirrorHandler.create_directory')
+    @patch.object(MirrorHandler, 'create_directory')
     def test_on_any_event_created_directory(
             self,
             mock_create_directory: MagicMock
@@ -151,15 +111,13 @@ class TestMirrorHandler(unittest.TestCase):
         Test the `on_any_event` method for handling a created directory event.
         """
         new_dir = self.dir_a / "new_dir"
-        event = FileSystemEvent(src_path=str(new_dir))
-        event.event_type = FileSystemEvents.CREATED.value
-        event.is_directory = True
+        event = make_event(new_dir, CREATED, is_directory=True)
 
         self.handler.on_any_event(event)
         mock_create_directory.assert_called_once_with(
             self.dir_a, new_dir, self.dir_b)
 
-    @patch('syncdog.mirror_handler.MirrorHandler.delete')
+    @patch.object(MirrorHandler, 'delete')
     def test_on_any_event_deleted_file(self, mock_delete: MagicMock) -> None:
         """
         Test the handler's response to a file deletion event.
@@ -167,32 +125,26 @@ class TestMirrorHandler(unittest.TestCase):
         handler's `delete` method is called exactly once with the correct file
         path.
         """
-        self.assertTrue(self.test_file_a.exists())
-        event = FileSystemEvent(src_path=str(self.test_file_a))
-        event.event_type = FileSystemEvents.DELETED.value
+        event = make_event(self.test_file_a, DELETED)
 
         self.handler.on_any_event(event)
         mock_delete.assert_called_once_with(
             self.dir_a, self.test_file_a, self.dir_b)
 
-    @patch('syncdog.mirror_handler.MirrorHandler.rename')
+    @patch.object(MirrorHandler, 'rename')
     def test_on_any_event_moved_file(self, mock_rename: MagicMock) -> None:
         """
         This test verifies that the `rename` method is called once with the
         correct event when a file is moved.
         """
         test_file_moved = self.dir_a / "moved_file.txt"
-        self.assertFalse(test_file_moved.exists())
-
-        event = FileSystemEvent(
-            src_path=str(self.test_file_a), dest_path=str(test_file_moved))
-        event.event_type = FileSystemEvents.MOVED.value
+        event = make_event(self.test_file_a, MOVED, dest_path=test_file_moved)
         self.handler.on_any_event(event)
 
         mock_rename.assert_called_once_with(
             event, self.dir_a, self.dir_b)
 
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
+    @patch.object(MirrorHandler, 'track_work_file')
     def test_on_any_event_modified_file(
             self,
             mock_track_work_file: MagicMock
@@ -200,21 +152,30 @@ class TestMirrorHandler(unittest.TestCase):
         """
         Test that the handler correctly tracks a modified file event.
         """
-        with open(self.test_file_a, 'ab') as file:
-            file.write(b"Hallo, World!")
-        event = FileSystemEvent(src_path=str(self.test_file_a))
-        event.event_type = FileSystemEvents.MODIFIED.value
+        modified_size = len(self.test_file_data) + len(b"Hallo, World!")
+        real_stat = Path.stat
 
-        self.handler.on_any_event(event)
+        def stat(path: Path, *args, **kwargs) -> os.stat_result:
+            # Only test_file_a reports the grown size; every other path keeps
+            # its real stat so dest_path.exists() and sizes stay truthful.
+            if path == self.test_file_a:
+                return os.stat_result((0,) * 6 + (modified_size, 0, 0, 0))
+            return real_stat(path, *args, **kwargs)
+
+        event = make_event(self.test_file_a, MODIFIED)
+
+        with patch.object(Path, 'stat', autospec=True, side_effect=stat):
+            self.handler.on_any_event(event)
 
         mock_track_work_file.assert_called_once_with(
             event.event_type, self.dir_a, self.test_file_a, self.dir_b,
             self.patch_path_b)
+        stat_b = self.test_file_b.stat()
         self.assertEqual(
-            self.handler.working_files[self.test_file_b],
-            self.test_file_b.stat().st_size)
+            self.handler.working_files[str(self.test_file_b)],
+            (stat_b.st_size, stat_b.st_mtime_ns))
 
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
+    @patch.object(MirrorHandler, 'track_work_file')
     def test_on_any_event_modified_is_directory(
             self,
             mock_track_work_file: MagicMock
@@ -224,15 +185,13 @@ class TestMirrorHandler(unittest.TestCase):
         """
         modified_dir = self.dir_a / "modified_dir"
         modified_dir.mkdir()
-        event = FileSystemEvent(src_path=str(modified_dir))
-        event.event_type = FileSystemEvents.MODIFIED.value
-        event.is_directory = True
+        event = make_event(modified_dir, MODIFIED, is_directory=True)
 
         self.handler.on_any_event(event)
-        self.assertNotIn(modified_dir, self.handler.working_files)
+        self.assertNotIn(str(modified_dir), self.handler.working_files)
         mock_track_work_file.assert_not_called()
 
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
+    @patch.object(MirrorHandler, 'track_work_file')
     def test_on_any_event_modified_file_in_working_files(
             self,
             mock_track_work_file: MagicMock
@@ -242,16 +201,15 @@ class TestMirrorHandler(unittest.TestCase):
         being copied.
         """
         modified_file = self.dir_a / "modified_file.txt"
-        event = FileSystemEvent(src_path=str(modified_file))
-        event.event_type = FileSystemEvents.MODIFIED.value
+        event = make_event(modified_file, MODIFIED)
 
-        self.handler.working_files[Path(event.src_path)] = \
-            len(self.test_file_data)
+        self.handler.working_files[event.src_path] = \
+            (len(self.test_file_data), 0)
 
         self.handler.on_any_event(event)
         mock_track_work_file.assert_not_called()
 
-    @patch('syncdog.mirror_handler.MirrorHandler.track_work_file')
+    @patch.object(MirrorHandler, 'track_work_file')
     def test_on_any_event_dest_path_exists(
             self,
             mock_track_work_file: MagicMock
@@ -260,8 +218,7 @@ class TestMirrorHandler(unittest.TestCase):
         Test that the handler does not track a modified file event when the
         destination file already exists.
         """
-        event = FileSystemEvent(src_path=str(self.test_file_a))
-        event.event_type = FileSystemEvents.MODIFIED.value
+        event = make_event(self.test_file_a, MODIFIED)
 
         self.handler.on_any_event(event)
 
@@ -272,6 +229,7 @@ class TestMirrorHandler(unittest.TestCase):
         Test the `cleanup` method.
         """
         self.handler.cleanup()
+        self.handler.wait_for_cleanup()
         self.assertFalse(self.patch_path_a.exists())
         self.assertFalse(self.patch_path_b.exists())
         self.assertIsNone(self.handler.patch_path_a)
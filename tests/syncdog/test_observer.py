@@ -1,76 +1,83 @@
 import unittest
-import tempfile
-import shutil
 from pathlib import Path
-import threading
+from unittest.mock import patch
 
-from syncdog.observer import SyncDogObserver
+from syncdog.observer import EVENT_FILTER, SyncDogObserver
 
 from watchdog.events import FileSystemEventHandler
 
 
 class TestSyncDogObserver(unittest.TestCase):
+    """
+    The watchdog Observer is mocked and `run` is driven in-process: the mock
+    observer's `start` sets the stop event, so `run` returns as soon as it
+    has scheduled and started the observer, without an OS thread.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._default_handler = FileSystemEventHandler()
+
     def setUp(self):
-        self.source = Path(tempfile.mkdtemp())
-        self.destination = Path(tempfile.mkdtemp())
-        self.handler = FileSystemEventHandler()
+        observer_patcher = patch('syncdog.observer.Observer')
+        self.mock_observer = observer_patcher.start()
+        self.addCleanup(observer_patcher.stop)
+        self.source = Path('/fake/src')
+        self.destination = Path('/fake/dst')
+        self.handler = self._default_handler
         self.observer = SyncDogObserver(
             directory=self.source, handler=self.handler)
-        self.thread = threading.Thread(target=self.observer.run)
+        self.running_states = []
+        mock_observer = self.mock_observer.return_value
+        mock_observer.start.side_effect = self.observer.stop
+        mock_observer.join.side_effect = lambda: self.running_states.append(
+            self.observer.is_running)
 
     def test_run(self):
-        self.thread.start()
-        # Allow some time for the observer to start
-        self.thread.join(timeout=1)
-        self.assertTrue(self.observer.is_running)
+        self.observer.run()
+        self.assertEqual(self.running_states, [True])
+        mock_observer = self.mock_observer.return_value
+        mock_observer.schedule.assert_called_once_with(
+            self.handler, self.source, recursive=True,
+            event_filter=EVENT_FILTER)
+        mock_observer.start.assert_called_once()
+        mock_observer.stop.assert_called_once()
 
     def test_run_multiple_directories(self):
         self.observer.set_directory([self.source, self.destination])
-        self.thread.start()
-        # Allow some time for the observer to start
-        self.thread.join(timeout=1)
-        self.assertTrue(self.observer.is_running)
-        self.assertTrue(
+        self.observer.run()
+        self.assertEqual(self.running_states, [True])
+        self.assertEqual(
             self.observer.directory, [self.source, self.destination]
         )
+        self.assertEqual(
+            self.mock_observer.return_value.schedule.call_count, 2)
 
     def test_stop(self):
-        self.thread.start()
-        self.observer.stop()
-        self.thread.join(timeout=1)
+        self.observer.run()
         self.assertFalse(self.observer.is_running)
+        self.assertFalse(self.observer._stop_event.is_set())
 
     def test_set_directory(self):
-        self.thread.start()
         self.assertEqual(self.observer.directory, self.source)
-        self.observer.stop()
-        self.thread.join(timeout=1)
         self.observer.set_directory(self.destination)
         self.assertEqual(self.observer.directory, self.destination)
 
     def test_set_directoryy_error(self):
-        self.thread.start()
-        self.assertEqual(self.observer.directory, self.source)
-        self.thread.join(timeout=1)
+        self.observer._is_running = True
         with self.assertRaises(RuntimeError):
             self.observer.set_directory(self.destination)
 
         self.assertEqual(self.observer.directory, self.source)
-        print(f'observer is_running: {self.observer.is_running}')
 
     def test_set_handler(self):
-        self.thread.start()
         self.assertEqual(self.observer.handler, self.handler)
-        self.observer.stop()
-        self.thread.join(timeout=1)
         new_handler = FileSystemEventHandler()
         self.observer.set_handler(new_handler)
         self.assertEqual(self.observer.handler, new_handler)
 
     def test_set_handler_when_running(self):
-        self.thread.start()
-        self.assertEqual(self.observer.handler, self.handler)
-        self.thread.join(timeout=1)
+        self.observer._is_running = True
         with self.assertRaises(RuntimeError):
             self.observer.set_handler(FileSystemEventHandler())
 
@@ -93,8 +100,3 @@ class TestSyncDogObserver(unittest.TestCase):
             str(self.observer),
             "SyncDogObserver not monitoring any directory."
         )
-
-    def tearDown(self):
-        self.observer.stop()
-        shutil.rmtree(self.source)
-        shutil.rmtree(self.destination)
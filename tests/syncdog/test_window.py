@@ -3,25 +3,83 @@ from pathlib import Path
 import unittest
 from unittest.mock import patch, MagicMock
 
-from PySide6 import QtTest, QtCore, QtWidgets
+from PySide6 import QtCore, QtTest, QtWidgets
 from syncdog.window import SyncDogWindow
 from syncdog.constants import SyncMode
-from typing import Literal
+
+from tests._spy import Spy
+
+
+SELECTOR_BUTTONS = (
+    'button_a', 'button_b', 'button_AtoB', 'button_BtoA', 'button_mirror'
+)
+# Directories assigned to alpha_path and beta_path by the state tests.
+PATH_A = Path("/path/to/source")
+PATH_B = Path("/path/to/destination")
+# (enabled, text) of each push button on a freshly constructed window.
+INITIAL_BUTTON_STATES = {
+    'button_a': (True, '...'),
+    'button_b': (True, '...'),
+    'button_AtoB': (True, 'A to B'),
+    'button_BtoA': (True, 'B to A'),
+    'button_mirror': (True, 'Mirror'),
+    'button_action': (False, 'Synchronize'),
+}
+
+_app = None
+
+
+def _get_app() -> QtWidgets.QApplication:
+    """
+    Returns the QApplication shared by the whole test run, creating it on
+    first use. It is never quit, since shutting the event loop down and
+    recreating it is slow. Unless QT_QPA_PLATFORM is already set, it uses the
+    offscreen platform plugin, so the one-time platform start-up does not
+    wait on a window manager.
+    """
+    global _app
+    if _app is None:
+        _app = QtWidgets.QApplication.instance()
+        if _app is None:
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+            _app = QtWidgets.QApplication([])
+    return _app
 
 
 class TestSyncFilesWindow(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        if not QtWidgets.QApplication.instance():
-            cls.app = QtWidgets.QApplication([])
+        cls.app = _get_app()
+        cls.window = SyncDogWindow(testing=True)
+        cls.spy_start = Spy()
+        cls.spy_stop = Spy()
+        cls.window.start_observer_signal.connect(cls.spy_start)
+        cls.window.stop_observer_signal.connect(cls.spy_stop)
 
     def setUp(self) -> None:
-        os.environ['UNIT_TESTING'] = '1'
-        self.window = SyncDogWindow()
-        self.window.show()
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Restores the shared window to the state of a freshly constructed one,
+        so the widget tree is only built once per class. Visibility is left
+        alone; the tests that depend on it show the window themselves.
+        """
+        window = self.window
+        window.mode = SyncMode.IDLE
+        window.alpha_path = None
+        window.beta_path = None
+        window.retranslateUi(window)
+        self._set_buttons_enabled(True, action=False)
+        window.update_styles()
+        window.set_tray_icon("off")
+        window.statusbar.clearMessage()
+        self.spy_start.calls.clear()
+        self.spy_stop.calls.clear()
 
     def test_initial_state(self) -> None:
         """Check initial state of the window"""
+        self.window.show()
         self.assertTrue(self.window.isVisible())
         self.assertEqual(self.window.windowTitle(), 'SyncDog')
 
@@ -29,29 +87,23 @@ class TestSyncFilesWindow(unittest.TestCase):
 
     def test_initial_state_buttons(self) -> None:
         """Initial state of buttons"""
-        for button in (
-            {'name': 'button_a', 'enabled': True, 'text': '...'},
-            {'name': 'button_b', 'enabled': True, 'text': '...'},
-            {'name': 'button_AtoB', 'enabled': True, 'text': 'A to B'},
-            {'name': 'button_BtoA', 'enabled': True, 'text': 'B to A'},
-            {'name': 'button_mirror', 'enabled': True, 'text': 'Mirror'},
-            {'name': 'button_action', 'enabled': False, 'text': 'Synchronize'}
-        ):
-            current_button = self.window.findChild(
-                QtWidgets.QPushButton, button['name'])
-            self.assertIsNotNone(current_button)
-            self.assertTrue(current_button.isEnabled() == button['enabled'])
-            self.assertEqual(current_button.text(), button['text'])
+        # One tree walk; the comparison is then plain Python, and assertEqual
+        # on the dicts still names every button that differs.
+        states = {
+            button.objectName(): (button.isEnabled(), button.text())
+            for button in self.window.findChildren(QtWidgets.QPushButton)
+        }
+        self.assertEqual(
+            {name: states.get(name) for name in INITIAL_BUTTON_STATES},
+            INITIAL_BUTTON_STATES)
 
     def test_initial_tray(self) -> None:
         """
         Verifies the tray icon is not None and is visible.
         """
-        tray_icon = self.window.findChild(
-            QtWidgets.QSystemTrayIcon, 'tray_icon')
-        self.assertIsNotNone(tray_icon)
+        tray_icon = self.window.tray_icon
+        self.assertEqual(tray_icon.objectName(), 'tray_icon')
         self.assertEqual(tray_icon.isVisible(), True)
-        # self.assertEqual()
 
     def test_tray_icon_action(self) -> None:
         """
@@ -61,46 +113,46 @@ class TestSyncFilesWindow(unittest.TestCase):
         self.window.hide()
         self.assertFalse(self.window.isVisible())
         self.assertFalse(self.window.isActiveWindow())
-        tray_icon = self.window.findChild(
-            QtWidgets.QSystemTrayIcon, 'tray_icon')
-        self.assertIsNotNone(tray_icon)
+        tray_icon = self.window.tray_icon
+        self.assertEqual(tray_icon.objectName(), 'tray_icon')
 
         tray_icon.activated.emit(QtWidgets.QSystemTrayIcon.DoubleClick)
 
-        QtTest.QTest.qWait(100)
-
+        self.assertTrue(QtTest.QTest.qWaitForWindowActive(self.window, 500))
         self.assertTrue(self.window.isVisible())
-        self.assertTrue(self.window.isActiveWindow())
 
     def test_intiial_state_statusbar(self) -> None:
         """
         Ensures that the status bar is present and its initial message is empty.
         """
-        statusbar = self.window.findChild(
-            QtWidgets.QStatusBar, 'statusbar')
-        self.assertIsNotNone(statusbar)
+        statusbar = self.window.statusbar
+        self.assertIs(self.window.statusBar(), statusbar)
         self.assertEqual(statusbar.currentMessage(), '')
 
-    @patch('PySide6.QtWidgets.QFileDialog.getExistingDirectory')
-    def test_button_path_action_alpha(
-        self,
-        mock_get_existing_directory: MagicMock
-    ) -> None:
+    def test_button_path_action(self) -> None:
         """
-        Test the button action for setting the alpha path.
-
-        Args:
-            mock_get_existing_directory (MagicMock): Mock for the directory
-                selection dialog.
+        Test the path buttons set the matching label and path, and that an
+        empty selection leaves the path unset.
         """
-        mock_get_existing_directory.return_value = r"C:\source_a"
-
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_a')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
+        for button, label, path_attr, chosen, exp_text, exp_path in (
+            ('button_a', 'label_a', 'alpha_path', r"C:\source_a",
+             r"C:\source_a", Path(r"C:\source_a")),
+            ('button_b', 'label_b', 'beta_path', r"C:\source_b",
+             r"C:\source_b", Path(r"C:\source_b")),
+            ('button_a', 'label_a', 'alpha_path', '',
+             'Select a directory...', None),
+        ):
+            with self.subTest(button=button, chosen=chosen):
+                self._reset()
+                with patch.object(QtWidgets.QFileDialog,
+                                  'getExistingDirectory', Spy(chosen)):
+                    getattr(self.window, button).click()
 
-        self.assertEqual(self.window.label_a.text(), r"C:\source_a")
-        self.assertEqual(self.window.alpha_path, Path(r"C:\source_a"))
+                self.assertEqual(
+                    getattr(self.window, label).text(), exp_text)
+                self.assertEqual(getattr(self.window, path_attr), exp_path)
 
+    @patch.dict(os.environ, {'GUI_TESTING': '1'})
     @patch('syncdog.window.SyncDogWindow.select_path')
     def test_button_path_action_alpha_gui_testing(
         self,
@@ -111,17 +163,16 @@ class TestSyncFilesWindow(unittest.TestCase):
         set.
         """
 
-        os.environ['GUI_TESTING'] = '1'
         mock_select_path.return_value = r'C:\tmp\SyncDogTest'
 
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_a')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
+        self.window.button_a.click()
         mock_select_path.assert_called_once_with(
             caption='Select Directory A', dir=r'C:\tmp\SyncDogTest'
         )
         self.assertEqual(self.window.label_a.text(), r'C:\tmp\SyncDogTest')
         self.assertEqual(self.window.alpha_path, Path(r'C:\tmp\SyncDogTest'))
 
+    @patch.dict(os.environ, {'GUI_TESTING': '1'})
     @patch('syncdog.window.SyncDogWindow.select_path')
     def test_button_path_action_beta_gui_testing(
         self,
@@ -132,11 +183,9 @@ class TestSyncFilesWindow(unittest.TestCase):
         set.
         """
 
-        os.environ['GUI_TESTING'] = '1'
         mock_select_path.return_value = r'C:\tmp\SyncDogTest_Dest'
 
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_b')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
+        self.window.button_b.click()
         mock_select_path.assert_called_once_with(
             caption='Select Directory B', dir=r'C:\tmp\SyncDogTest_Dest'
         )
@@ -145,124 +194,66 @@ class TestSyncFilesWindow(unittest.TestCase):
         self.assertEqual(
             self.window.beta_path, Path(r'C:\tmp\SyncDogTest_Dest'))
 
-    @patch('PySide6.QtWidgets.QFileDialog.getExistingDirectory')
-    def test_button_path_action_beta(
-        self,
-        mock_get_existing_directory: MagicMock
-    ) -> None:
+    def test_button_click_mode(self) -> None:
         """
-        Test the button action for setting the beta path.
-
-        Args:
-            mock_get_existing_directory (MagicMock): Mock for the directory
-                selection dialog.
-        """
-
-        mock_get_existing_directory.return_value = r"C:\source_b"
-
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_b')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
-
-        self.assertEqual(self.window.label_b.text(), r"C:\source_b")
-        self.assertEqual(self.window.beta_path, Path(r"C:\source_b"))
-
-    @patch('PySide6.QtWidgets.QFileDialog.getExistingDirectory')
-    def test_button_path_empty(
-        self,
-        mock_get_existing_directory: MagicMock
-    ) -> None:
+        Test that clicking each mode button switches to its mode.
         """
-        Test case for verifying the behavior when the directory selection button
-        is clicked but no directory is selected.
-        Args:
-            mock_get_existing_directory (MagicMock): Mock object for the
-                directory selection dialog.
-        """
-        mock_get_existing_directory.return_value = ''
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_a')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
-
-        self.assertEqual(self.window.label_a.text(), 'Select a directory...')
-        self.assertEqual(self.window.alpha_path, None)
-
-    def test_button_click_a_to_b(self) -> None:
-        """
-        Test the button click event that changes the mode from A to B.
-        """
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_AtoB')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
-        self.assertEqual(self.window.mode, SyncMode.ATOB)
-
-    def test_button_click_b_to_a(self) -> None:
-        """
-        Test the button click event that changes the mode from B to A.
-        """
-        button = self.window.findChild(QtWidgets.QPushButton, 'button_BtoA')
-        QtTest.QTest.mouseClick(button, QtCore.Qt.LeftButton)
-        self.assertEqual(self.window.mode, SyncMode.BTOA)
-
-    def close_active_widget(self, button: Literal['yes', 'no'] = 'no') -> None:
-        """
-        Closes the active widget by simulating a button click on a confirmation
-        message box.
-        Args:
-            button (Literal['yes', 'no']): The button to click on the message
-                box. Defaults to 'no'.
-        """
-
-        message_box = self.window.findChild(
-            QtWidgets.QMessageBox, 'confirmQuitMessageBox')
-        QtTest.QTest.qWaitForWindowExposed(message_box)
-        self.assertIsNotNone(message_box)
-
-        press = message_box.button(QtWidgets.QMessageBox.No) if button == 'no' \
-            else message_box.button(QtWidgets.QMessageBox.Yes)
-        self.assertIsNotNone(press)
-        self.assertTrue(press.isVisible())
-        # Simulate a left mouse click on the "No" button
-        QtTest.QTest.mouseClick(press, QtCore.Qt.LeftButton)
-        if button == 'no':
-            self.assertTrue(self.window.isVisible())
-
-    def test_close_event_yes_button(self) -> None:
-        """
-        Test the close event of the window when the 'yes' button is clicked.
-        """
-
-        del os.environ['UNIT_TESTING']
-        self.assertTrue(self.window.isVisible())
-        QtCore.QTimer.singleShot(250, lambda: self.close_active_widget('yes'))
-        self.window.close()
-
-        os.environ['UNIT_TESTING'] = '1'
+        for button, mode in (
+            ('button_AtoB', SyncMode.ATOB),
+            ('button_BtoA', SyncMode.BTOA),
+            ('button_mirror', SyncMode.MIRROR),
+        ):
+            with self.subTest(button=button):
+                self._reset()
+                getattr(self.window, button).click()
+                self.assertEqual(self.window.mode, mode)
 
-    def test_close_event_no_button(self) -> None:
+    def test_close_event(self) -> None:
         """
-        Test the close event of the window when the 'no' button is clicked.
+        Test that closing the window asks for confirmation and only hides the
+        window when the user confirms. Declining runs first so both cases
+        share the one show().
         """
-
-        del os.environ['UNIT_TESTING']
-        self.assertTrue(self.window.isVisible())
-        QtCore.QTimer.singleShot(250, lambda: self.close_active_widget('no'))
-
-        self.window.close()
-        os.environ['UNIT_TESTING'] = '1'
-
-    @patch('PySide6.QtWidgets.QMessageBox.exec',
-           return_value=QtWidgets.QMessageBox.Ok)
-    def test_confirm_start_ok(self, mock_exec: MagicMock) -> None:
+        self.window.show()
+        for confirmed in (False, True):
+            with self.subTest(confirmed=confirmed):
+                with patch.object(self.window, 'testing', False), \
+                        patch.object(self.window, 'confirm_quit',
+                                     Spy(confirmed)) as spy_confirm_quit:
+                    self.window.close()
+
+                self.assertEqual(len(spy_confirm_quit.calls), 1)
+                self.assertEqual(self.window.isVisible(), not confirmed)
+
+    def test_confirm_quit_yes(self) -> None:
+        """Test confirm_quit method when 'Yes' is clicked."""
+        with patch.object(QtWidgets.QMessageBox, 'exec',
+                          Spy(QtWidgets.QMessageBox.Yes)) as spy_exec:
+            self.assertTrue(self.window.confirm_quit())
+        self.assertEqual(len(spy_exec.calls), 1)
+
+    def test_confirm_quit_no(self) -> None:
+        """Test confirm_quit method when 'No' is clicked."""
+        with patch.object(QtWidgets.QMessageBox, 'exec',
+                          Spy(QtWidgets.QMessageBox.No)) as spy_exec:
+            self.assertFalse(self.window.confirm_quit())
+        self.assertEqual(len(spy_exec.calls), 1)
+
+    def test_confirm_start_ok(self) -> None:
         """Test confirm_start method when 'OK' is clicked."""
-        result = self.window.confirm_start()
-        self.assertTrue(result)
-        mock_exec.assert_called_once()
+        with patch.object(QtWidgets.QMessageBox, 'exec',
+                          Spy(QtWidgets.QMessageBox.Ok)) as spy_exec:
+            result = self.window.confirm_start()
+            self.assertTrue(result)
+        self.assertEqual(len(spy_exec.calls), 1)
 
-    @patch('PySide6.QtWidgets.QMessageBox.exec',
-           return_value=QtWidgets.QMessageBox.Cancel)
-    def test_confirm_start_cancel(self, mock_exec: MagicMock) -> None:
+    def test_confirm_start_cancel(self) -> None:
         """Test confirm_start method when 'Cancel' is clicked."""
-        result = self.window.confirm_start()
-        self.assertFalse(result)
-        mock_exec.assert_called_once()
+        with patch.object(QtWidgets.QMessageBox, 'exec',
+                          Spy(QtWidgets.QMessageBox.Cancel)) as spy_exec:
+            result = self.window.confirm_start()
+            self.assertFalse(result)
+        self.assertEqual(len(spy_exec.calls), 1)
 
     def test_main_button_stop_action(self) -> None:
         """
@@ -271,59 +262,35 @@ class TestSyncFilesWindow(unittest.TestCase):
         the stop signal is emitted once, the start signal is not emitted, and
         the toggle_buttons_enabled method is called with the correct parameters.
         """
-        self.window.alpha_path = Path(r'C:\source')
-        self.window.alpha_path = Path(r'C:\dest')
+        self.window.alpha_path = PATH_A
+        self.window.beta_path = PATH_B
         self.window.mode = SyncMode.ATOB
-        self.window.button_a.setEnabled(False)
-        self.window.button_b.setEnabled(False)
-        self.window.button_AtoB.setEnabled(False)
-        self.window.button_BtoA.setEnabled(False)
-        self.window.button_mirror.setEnabled(False)
-        self.window.button_action.setEnabled(True)
+        self._set_buttons_enabled(False, action=True)
         self.window.button_action.setText('Stop')
-        spy_stop = QtTest.QSignalSpy(self.window.stop_observer_signal)
-        spy_start = QtTest.QSignalSpy(self.window.start_observer_signal)
 
         self.window.main_button_action()
 
         self.assertEqual(self.window.button_action.text(), "Synchronize")
-        self.assertEqual(spy_stop.count(), 1)
-        self.assertEqual(spy_start.count(), 0)
-        self.assertTrue(self.window.button_a.isEnabled())
-        self.assertTrue(self.window.button_b.isEnabled())
-        self.assertTrue(self.window.button_AtoB.isEnabled())
-        self.assertTrue(self.window.button_BtoA.isEnabled())
-        self.assertTrue(self.window.button_mirror.isEnabled())
-        self.assertTrue(self.window.button_action.isEnabled())
+        self.assertEqual(len(self.spy_stop.calls), 1)
+        self.assertEqual(len(self.spy_start.calls), 0)
+        self._assert_buttons_enabled(True, action=True)
 
     def test_main_button_action(self) -> None:
         """
         Test the main_button_action method when the observer is started.
         """
-        self.window.alpha_path = Path(r'C:\source')
-        self.window.beta_path = Path(r'C:\dest')
+        self.window.alpha_path = PATH_A
+        self.window.beta_path = PATH_B
         self.window.mode = SyncMode.ATOB
-        self.window.button_a.setEnabled(True)
-        self.window.button_b.setEnabled(True)
-        self.window.button_AtoB.setEnabled(True)
-        self.window.button_BtoA.setEnabled(True)
-        self.window.button_mirror.setEnabled(True)
-        self.window.button_action.setEnabled(True)
-        spy_stop = QtTest.QSignalSpy(self.window.stop_observer_signal)
-        spy_start = QtTest.QSignalSpy(self.window.start_observer_signal)
-
-        self.window.confirm_start = MagicMock(return_value=True)
-        self.window.main_button_action()
+        self._set_buttons_enabled(True, action=True)
+
+        with patch.object(self.window, 'confirm_start', return_value=True):
+            self.window.main_button_action()
 
         self.assertEqual(self.window.button_action.text(), "Stop")
-        self.assertEqual(spy_stop.count(), 0)
-        self.assertEqual(spy_start.count(), 1)
-        self.assertFalse(self.window.button_a.isEnabled())
-        self.assertFalse(self.window.button_b.isEnabled())
-        self.assertFalse(self.window.button_AtoB.isEnabled())
-        self.assertFalse(self.window.button_BtoA.isEnabled())
-        self.assertFalse(self.window.button_mirror.isEnabled())
-        self.assertTrue(self.window.button_action.isEnabled())
+        self.assertEqual(len(self.spy_stop.calls), 0)
+        self.assertEqual(len(self.spy_start.calls), 1)
+        self._assert_buttons_enabled(False, action=True)
 
     def test_main_button_action_state_not_ready(self) -> None:
         """
@@ -332,188 +299,133 @@ class TestSyncFilesWindow(unittest.TestCase):
         self.window.alpha_path = None
         self.window.beta_path = None
         self.window.mode = SyncMode.ATOB
-        self.window.button_a.setEnabled(True)
-        self.window.button_b.setEnabled(True)
-        self.window.button_AtoB.setEnabled(True)
-        self.window.button_BtoA.setEnabled(True)
-        self.window.button_mirror.setEnabled(True)
-        self.window.button_action.setEnabled(True)
-        spy_stop = QtTest.QSignalSpy(self.window.stop_observer_signal)
-        spy_start = QtTest.QSignalSpy(self.window.start_observer_signal)
+        self._set_buttons_enabled(True, action=True)
 
         self.window.main_button_action()
 
         self.assertEqual(self.window.button_action.text(), "Synchronize")
-        self.assertEqual(spy_stop.count(), 0)
-        self.assertEqual(spy_start.count(), 0)
-        self.assertTrue(self.window.button_a.isEnabled())
-        self.assertTrue(self.window.button_b.isEnabled())
-        self.assertTrue(self.window.button_AtoB.isEnabled())
-        self.assertTrue(self.window.button_BtoA.isEnabled())
-        self.assertTrue(self.window.button_mirror.isEnabled())
-        self.assertTrue(self.window.button_action.isEnabled())
+        self.assertEqual(len(self.spy_stop.calls), 0)
+        self.assertEqual(len(self.spy_start.calls), 0)
+        self._assert_buttons_enabled(True, action=True)
 
     def test_main_button_action_state_ready_confirm_false(self) -> None:
         """
         Test the main_button_action method when the observer is not started.
         """
-        self.window.alpha_path = Path(r'C:\source')
-        self.window.beta_path = Path(r'C:\dest')
-        self.window.mode = SyncMode.ATOB
-        self.window.button_a.setEnabled(True)
-        self.window.button_b.setEnabled(True)
-        self.window.button_AtoB.setEnabled(True)
-        self.window.button_BtoA.setEnabled(True)
-        self.window.button_mirror.setEnabled(True)
-        self.window.button_action.setEnabled(True)
-        spy_stop = QtTest.QSignalSpy(self.window.stop_observer_signal)
-        spy_start = QtTest.QSignalSpy(self.window.start_observer_signal)
-
-        self.window.confirm_start = MagicMock(return_value=False)
-        self.window.main_button_action()
-
-        self.assertEqual(self.window.button_action.text(), "Synchronize")
-        self.assertEqual(spy_stop.count(), 0)
-        self.assertEqual(spy_start.count(), 0)
-        self.assertTrue(self.window.button_a.isEnabled())
-        self.assertTrue(self.window.button_b.isEnabled())
-        self.assertTrue(self.window.button_AtoB.isEnabled())
-        self.assertTrue(self.window.button_BtoA.isEnabled())
-        self.assertTrue(self.window.button_mirror.isEnabled())
-        self.assertTrue(self.window.button_action.isEnabled())
-
-    @patch('syncdog.window.SyncDogWindow.toggle_buttons_enabled')
-    def test_mode_switch_atob(
-        self,
-        mock_toggle_buttons_enabled: MagicMock
-    ) -> None:
-        self.window.mode_switch("atob")
-        self.assertEqual(self.window.mode, SyncMode.ATOB)
-        mock_toggle_buttons_enabled.assert_called_once_with(
-            enabled=self.window.state_ready())
-
-    @patch('syncdog.window.SyncDogWindow.toggle_buttons_enabled')
-    def test_mode_switch_btoa(
-        self,
-        mock_toggle_buttons_enabled: MagicMock
-    ) -> None:
-        self.window.mode_switch("btoa")
-        self.assertEqual(self.window.mode, SyncMode.BTOA)
-        mock_toggle_buttons_enabled.assert_called_once_with(
-            enabled=self.window.state_ready())
-
-    @patch('syncdog.window.SyncDogWindow.toggle_buttons_enabled')
-    def test_mode_switch_mirror(
-        self,
-        mock_toggle_buttons_enabled: MagicMock
-    ) -> None:
-        self.window.mode_switch("mirror")
-        self.assertEqual(self.window.mode, SyncMode.MIRROR)
-        mock_toggle_buttons_enabled.assert_called_once_with(
-            enabled=self.window.state_ready())
-
-    def test_set_directories_atob(self) -> None:
-        """Test set_directories method for SyncMode.ATOB."""
+        self.window.alpha_path = PATH_A
+        self.window.beta_path = PATH_B
         self.window.mode = SyncMode.ATOB
-        self.window.alpha_path = Path("/path/to/source")
-        self.window.beta_path = Path("/path/to/destination")
-
-        mode, source, destination = self.window.set_directories()
-
-        self.assertEqual(mode, SyncMode.ATOB)
-        self.assertEqual(source, Path("/path/to/source"))
-        self.assertEqual(destination, Path("/path/to/destination"))
-
-    def test_set_directories_btoa(self) -> None:
-        """Test set_directories method for SyncMode.BTOA."""
-        self.window.mode = SyncMode.BTOA
-        self.window.alpha_path = Path("/path/to/source")
-        self.window.beta_path = Path("/path/to/destination")
-
-        mode, source, destination = self.window.set_directories()
+        self._set_buttons_enabled(True, action=True)
 
-        self.assertEqual(mode, SyncMode.BTOA)
-        self.assertEqual(source, Path("/path/to/destination"))
-        self.assertEqual(destination, Path("/path/to/source"))
+        with patch.object(self.window, 'confirm_start', return_value=False):
+            self.window.main_button_action()
 
-    def test_set_directories_mirror(self) -> None:
-        """Test set_directories method for SyncMode.MIRROR."""
-        self.window.mode = SyncMode.MIRROR
-        self.window.alpha_path = Path("/path/to/source")
-        self.window.beta_path = Path("/path/to/destination")
+        self.assertEqual(self.window.button_action.text(), "Synchronize")
+        self.assertEqual(len(self.spy_stop.calls), 0)
+        self.assertEqual(len(self.spy_start.calls), 0)
+        self._assert_buttons_enabled(True, action=True)
 
-        mode, source, destination = self.window.set_directories()
+    def test_mode_switch(self) -> None:
+        """
+        Test that mode_switch sets each mode and re-evaluates which buttons are
+        enabled.
+        """
+        for name, mode in (
+            ('atob', SyncMode.ATOB),
+            ('btoa', SyncMode.BTOA),
+            ('mirror', SyncMode.MIRROR),
+        ):
+            with self.subTest(mode=name), \
+                    patch.object(self.window, 'toggle_buttons_enabled',
+                                 Spy()) as spy_toggle:
+                self._reset()
+                self.window.mode_switch(name)
+
+                self.assertEqual(self.window.mode, mode)
+                self.assertEqual(
+                    spy_toggle.calls,
+                    [((), {'enabled': self.window.state_ready()})])
+
+    def test_set_directories(self) -> None:
+        """
+        Test that set_directories returns the source and destination in the
+        direction of each mode.
+        """
+        for mode, source, destination in (
+            (SyncMode.ATOB, PATH_A, PATH_B),
+            (SyncMode.BTOA, PATH_B, PATH_A),
+            (SyncMode.MIRROR, PATH_A, PATH_B),
+        ):
+            with self.subTest(mode=mode):
+                self.window.mode = mode
+                self.window.alpha_path = PATH_A
+                self.window.beta_path = PATH_B
 
-        self.assertEqual(mode, SyncMode.MIRROR)
-        self.assertEqual(source, Path("/path/to/source"))
-        self.assertEqual(destination, Path("/path/to/destination"))
+                self.assertEqual(
+                    self.window.set_directories(), (mode, source, destination))
 
-    @patch('PySide6.QtWidgets.QMessageBox.information')
-    def test_state_read_same_paths(self, mock_information: MagicMock) -> None:
+    def test_state_read_same_paths(self) -> None:
         """Test state_ready method when alpha and beta paths are the same."""
-        self.window.alpha_path = Path(r'C:\source')
-        self.window.beta_path = Path(r'C:\source')
+        self.window.alpha_path = PATH_A
+        self.window.beta_path = PATH_A
         self.window.mode = SyncMode.ATOB
 
-        mock_information.return_value = QtWidgets.QMessageBox.Ok
-        result = self.window.state_ready()
+        with patch.object(self.window, 'show_information', Spy()) as spy_info:
+            result = self.window.state_ready()
 
         self.assertFalse(result)
-        mock_information.assert_called_once()
-
-    def test_toggle_buttons_enabled_enabled(self) -> None:
-        """
-        Test that the toggle_buttons_enabled method enables the action and
-        refresh buttons.
-        """
-        self.window.toggle_buttons_enabled(True)
-        self.assertTrue(self.window.button_action.isEnabled())
+        self.assertEqual(
+            spy_info.calls, [(("Path A and B are the same!",), {})])
 
-    def test_toggle_buttons_enabled_not_enabled(self) -> None:
+    def test_toggle_buttons_enabled(self) -> None:
         """
-        Test that the toggle_buttons_enabled method disables the action and
-        refresh buttons.
+        Test that toggle_buttons_enabled switches only the action button by
+        default, and only the path and mode buttons when start_action is True.
         """
-
-        self.window.toggle_buttons_enabled(False)
-        self.assertFalse(self.window.button_action.isEnabled())
-
-    def test_toggle_buttons_enabled_enabled_start_action_true(self) -> None:
+        for enabled, start_action in (
+            (True, False), (False, False), (True, True), (False, True)
+        ):
+            with self.subTest(enabled=enabled, start_action=start_action):
+                self._reset()
+                self.window.toggle_buttons_enabled(
+                    enabled=enabled, start_action=start_action)
+
+                # A fresh window has the path and mode buttons enabled and
+                # the action button disabled.
+                self._assert_buttons_enabled(
+                    enabled if start_action else True,
+                    action=False if start_action else enabled)
+
+    def _assert_buttons_enabled(
+            self,
+            enabled: bool,
+            action: bool | None = None
+    ) -> None:
         """
-        Test that all buttons are enabled when toggle_buttons_enabled is called
-        with True.
+        Asserts the enabled state of the path and mode buttons, and of the
+        action button when `action` is given.
         """
-        self.window.toggle_buttons_enabled(True)
-        self.assertTrue(self.window.button_a.isEnabled())
-        self.assertTrue(self.window.button_b.isEnabled())
-        self.assertTrue(self.window.button_AtoB.isEnabled())
-        self.assertTrue(self.window.button_BtoA.isEnabled())
-        self.assertTrue(self.window.button_mirror.isEnabled())
+        for name in SELECTOR_BUTTONS:
+            with self.subTest(button=name):
+                self.assertEqual(
+                    getattr(self.window, name).isEnabled(), enabled)
+        if action is not None:
+            self.assertEqual(self.window.button_action.isEnabled(), action)
 
-    def test_toggle_buttons_enabled_not_enabled_start_action_true(self) -> None:
+    def _set_buttons_enabled(self, enabled: bool, action: bool) -> None:
         """
-        Test that the 'toggle_buttons_enabled' method enables all relevant
-        buttons when the start action is set to True.
-
-        This test verifies that when the 'toggle_buttons_enabled' method is
-        called with a False argument, the following buttons are disabled:
-        button_a, button_b, button_AtoB, button_BtoA, button_mirror
+        Sets the enabled state of the path and mode buttons and of the action
+        button.
         """
-        self.window.toggle_buttons_enabled(enabled=False, start_action=True)
-        self.assertFalse(self.window.button_a.isEnabled())
-        self.assertFalse(self.window.button_b.isEnabled())
-        self.assertFalse(self.window.button_AtoB.isEnabled())
-        self.assertFalse(self.window.button_BtoA.isEnabled())
-        self.assertFalse(self.window.button_mirror.isEnabled())
-
-    def tearDown(self) -> None:
-        self.window.close()
+        for name in SELECTOR_BUTTONS:
+            getattr(self.window, name).setEnabled(enabled)
+        self.window.button_action.setEnabled(action)
 
     @classmethod
     def tearDownClass(cls):
-        if QtWidgets.QApplication.instance():
-            cls.app.quit()
-            QtCore.QCoreApplication.quit()
+        cls.window.close()
+        cls.window.deleteLater()
+        cls.app.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,34 @@
 from pathlib import Path
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import main
 from syncdog.constants import SyncMode
 
 
 class TestMain(unittest.TestCase):
-    @patch('main.QApplication')
-    @patch('main.SyncDogWindow')
-    @patch('main.sys')
-    def test_main(self, mock_sys, mock_syncdog_window, mock_qapp) -> None:
+    _GLOBALS = ('handler', 'mirror_handler', 'observer', 'threading')
+
+    def setUp(self) -> None:
+        # Plain attribute swaps on the main module; cheaper than a stack of
+        # patch decorators. Replacing main.threading keeps the real
+        # threading module untouched.
+        originals = {name: getattr(main, name) for name in self._GLOBALS}
+        self.addCleanup(self._restore_globals, originals)
+        for name in self._GLOBALS:
+            setattr(main, name, MagicMock())
+
+    @staticmethod
+    def _restore_globals(originals: dict) -> None:
+        for name, value in originals.items():
+            setattr(main, name, value)
+
+    @patch.multiple(
+        'main', QApplication=DEFAULT, SyncDogWindow=DEFAULT, sys=DEFAULT)
+    def test_main(self, **mocks: MagicMock) -> None:
+        mock_qapp = mocks['QApplication']
+        mock_syncdog_window = mocks['SyncDogWindow']
+        mock_sys = mocks['sys']
         mock_window = MagicMock()
         mock_window.show = MagicMock()
 
@@ -29,83 +47,52 @@ class TestMain(unittest.TestCase):
         mock_window.show.assert_called_once()
         mock_app_instance.exec.assert_called_once()
 
-    @patch('main.threading.Thread')
-    @patch('main.handler')
-    @patch('main.observer')
-    def test_start_syncing_atob(
-        self,
-        mock_observer: MagicMock,
-        mock_file_handler: MagicMock,
-        mock_thread: MagicMock
-    ) -> None:
+    def test_start_syncing_atob(self) -> None:
         source = Path(r'C:\source')
         destination = Path(r'C:\destination')
 
         main.start_syncing(SyncMode.ATOB, source, destination)
 
-        mock_file_handler.set_source.assert_called_once_with(source)
-        mock_file_handler.set_destination.assert_called_once_with(
-            destination)
-        mock_observer.set_directory.assert_called_once_with(source)
-        mock_thread.assert_called_once_with(target=mock_observer.run)
-        mock_thread.return_value.start.assert_called_once()
-
-    @patch('main.threading.Thread')
-    @patch('main.handler')
-    @patch('main.observer')
-    def test_start_syncing_btoa(
-        self,
-        mock_observer: MagicMock,
-        mock_file_handler: MagicMock,
-        mock_thread: MagicMock
-    ) -> None:
+        main.handler.set_source.assert_called_once_with(source)
+        main.handler.set_destination.assert_called_once_with(destination)
+        main.observer.set_directory.assert_called_once_with(source)
+        main.threading.Thread.assert_called_once_with(
+            target=main.observer.run)
+        main.threading.Thread.return_value.start.assert_called_once()
+
+    def test_start_syncing_btoa(self) -> None:
         source = Path(r'C:\source')
         destination = Path(r'C:\destination')
 
         main.start_syncing(SyncMode.BTOA, source, destination)
 
-        mock_file_handler.set_source.assert_called_once_with(source)
-        mock_file_handler.set_destination.assert_called_once_with(destination)
-        mock_observer.set_directory.assert_called_once_with(source)
-        mock_thread.assert_called_once_with(target=mock_observer.run)
-        mock_thread.return_value.start.assert_called_once()
-
-    @patch('main.threading.Thread')
-    @patch('main.mirror_handler')
-    @patch('main.observer')
-    def test_start_syncing_mirror(
-        self,
-        mock_observer: MagicMock,
-        mock_mirror_handler: MagicMock,
-        mock_thread: MagicMock
-    ) -> None:
+        main.handler.set_source.assert_called_once_with(source)
+        main.handler.set_destination.assert_called_once_with(destination)
+        main.observer.set_directory.assert_called_once_with(source)
+        main.threading.Thread.assert_called_once_with(
+            target=main.observer.run)
+        main.threading.Thread.return_value.start.assert_called_once()
+
+    def test_start_syncing_mirror(self) -> None:
         source = Path(r'C:\source')
         destination = Path(r'C:\destination')
 
         main.start_syncing(SyncMode.MIRROR, source, destination)
 
-        mock_mirror_handler.set_dir_a.assert_called_once_with(source)
-        mock_mirror_handler.set_dir_b.assert_called_once_with(
-            destination)
-        mock_observer.set_directory.assert_called_once_with(
+        main.mirror_handler.set_dir_a.assert_called_once_with(source)
+        main.mirror_handler.set_dir_b.assert_called_once_with(destination)
+        main.observer.set_directory.assert_called_once_with(
             [source, destination])
-        mock_thread.assert_called_once_with(target=mock_observer.run)
-        mock_thread.return_value.start.assert_called_once()
-
-    @patch('main.observer')
-    @patch('main.handler')
-    @patch('main.mirror_handler')
-    def test_stop_observer(
-            self,
-            mock_mirror_handler: MagicMock,
-            mock_handler: MagicMock,
-            mock_observer: MagicMock
-    ) -> None:
+        main.threading.Thread.assert_called_once_with(
+            target=main.observer.run)
+        main.threading.Thread.return_value.start.assert_called_once()
+
+    def test_stop_observer(self) -> None:
         main.stop_observer()
 
-        mock_observer.stop.assert_called_once()
-        mock_handler.cleanup.assert_called_once()
-        mock_mirror_handler.cleanup.assert_called_once()
+        main.observer.stop.assert_called_once()
+        main.handler.cleanup.assert_called_once()
+        main.mirror_handler.cleanup.assert_called_once()
 
 
 if __name__ == '__main__':